@@ -7,6 +7,9 @@ This script runs benchmarks for DataFrame operations across three libraries:
 - Polars (Rust)
 - Pandas (Python/NumPy)
 
+A pure NumPy sort + np.add.reduceat GroupBy and, when Numba is installed, a
+hand-written parallel Numba GroupBy kernel are included as reference baselines.
+
 Results are saved to JSON and can be rendered as Markdown tables.
 
 Usage:
@@ -14,16 +17,28 @@ Usage:
 """
 
 import argparse
+import gc
 import json
+import multiprocessing
+import operator
 import os
 import subprocess
 import sys
 import time
+import timeit
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 
 import numpy as np
 
+# Pin Polars' thread count explicitly (Polars reads this when its thread
+# pool starts) and silence plan logging so runs are reproducible
+os.environ.setdefault('POLARS_MAX_THREADS', str(os.cpu_count()))
+os.environ['POLARS_VERBOSE'] = '0'
+
 # Try to import optional dependencies
 try:
     import polars as pl
@@ -39,50 +54,144 @@ except ImportError:
     HAS_PANDAS = False
     print("Warning: Pandas not installed, skipping Pandas benchmarks")
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
-def run_benchmark(func, warmup=2, iterations=10):
-    """Run benchmark with warmup and return statistics in milliseconds"""
-    # Warmup
-    for _ in range(warmup):
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    print("Warning: Numba not installed, skipping Numba benchmarks")
+
+# Adaptive warmup: keep calling until the relative 95% confidence-interval
+# width (RCIW) of the last WARMUP_WINDOW calls drops below WARMUP_RCIW
+WARMUP_WINDOW = 5
+WARMUP_RCIW = 0.05
+WARMUP_MAX = 30
+
+# Thread limits exported to --parallel workers so concurrent suites don't
+# oversubscribe the cores they are pinned to
+WORKER_ENV = {
+    'OMP_NUM_THREADS': '1',
+    'POLARS_MAX_THREADS': '1',
+    'NUMBA_NUM_THREADS': '1',
+}
+
+# Keep every raw sample in the results ('all_times'); set by --verbose-timings
+VERBOSE_TIMINGS = False
+
+# Rows shown in the comparison tables: (result key, display name)
+OPERATIONS = (
+    ('sum', 'Sum'),
+    ('min', 'Min'),
+    ('max', 'Max'),
+    ('mean', 'Mean'),
+    ('filter', 'Filter (>0)'),
+    ('sort', 'Sort'),
+    ('groupby_sum', 'GroupBy Sum'),
+    ('groupby_mean', 'GroupBy Mean'),
+    ('groupby_multi', 'GroupBy Multi'),
+    ('inner_join', 'Inner Join'),
+    ('inner_join_lr', 'Inner Join (L x R)'),
+    ('inner_join_rl', 'Inner Join (R x L)'),
+    ('inner_join_sorted', 'Inner Join (sorted)'),
+    ('left_join', 'Left Join'),
+)
+
+# Table columns, in order; the speedup column is Pandas time / Polars time
+TABLE_LIBRARIES = ('polars', 'pandas', 'numpy', 'numba')
+TABLE_HEADERS = ('Polars', 'Pandas', 'NumPy', 'Numba')
+
+
+def warmup_until_stable(func, max_warmup=WARMUP_MAX):
+    """Call func until its timings stabilize and return the number of calls"""
+    window = deque(maxlen=WARMUP_WINDOW)
+    calls = 0
+    while calls < max_warmup:
+        start = time.perf_counter_ns()
         func()
+        window.append(time.perf_counter_ns() - start)
+        calls += 1
 
-    # Timed runs
-    times = []
-    for _ in range(iterations):
-        start = time.perf_counter()
-        result = func()
-        elapsed = (time.perf_counter() - start) * 1000  # Convert to ms
-        times.append(elapsed)
-        del result  # Ensure result is freed
+        if len(window) == WARMUP_WINDOW:
+            w = np.asarray(window)
+            median = np.median(w)
+            if median > 0:
+                rciw = (np.percentile(w, 97.5) - np.percentile(w, 2.5)) / median
+                if rciw < WARMUP_RCIW:
+                    break
+    return calls
 
-    times.sort()
-    return {
-        'median': times[len(times) // 2],
-        'min': times[0],
-        'max': times[-1],
-        'mean': np.mean(times),
-        'std': np.std(times),
-        'all_times': times,
+
+def run_benchmark(func, max_warmup=WARMUP_MAX, iterations=10):
+    """Run benchmark with warmup and return statistics in milliseconds"""
+    warmup_calls = warmup_until_stable(func, max_warmup)
+
+    # Calibrate loop count so each sample amortizes per-call overhead,
+    # then take `iterations` samples with the cyclic GC held off
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    gc_was_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        raw = timer.repeat(repeat=iterations, number=number)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    # Reclaim the discarded results here, outside the measured region
+    gc.collect()
+
+    times = np.asarray(raw) * (1000 / number)  # Convert to ms per call
+    mid = len(times) // 2
+    stats = {
+        'median': np.partition(times, mid)[mid],
+        'min': times.min(),
+        'max': times.max(),
+        'mean': times.mean(),
+        'std': times.std(),
+        'warmup_calls': warmup_calls,
     }
+    if VERBOSE_TIMINGS:
+        stats['all_times'] = times.tolist()
+    return stats
 
 
 def generate_data(n, seed=42):
     """Generate identical test data for all libraries"""
-    np.random.seed(seed)
+    # PCG64 generator: faster than the legacy global MT19937 state and
+    # reproducible without touching global RNG state
+    rng = np.random.default_rng(seed)
 
     left_n = n
     right_n = n // 2
     num_keys = n // 10
 
+    # Float columns are filled in place to avoid a temporary per column
+    left_vals = np.empty(left_n, dtype=np.float64)
+    right_vals = np.empty(right_n, dtype=np.float64)
+    values = np.empty(n, dtype=np.float64)
+
     return {
         # Join data
-        'left_ids': np.random.randint(0, num_keys, size=left_n, dtype=np.int64),
-        'left_vals': np.random.randn(left_n).astype(np.float64),
-        'right_ids': np.random.randint(0, num_keys, size=right_n, dtype=np.int64),
-        'right_vals': np.random.randn(right_n).astype(np.float64),
+        'left_ids': rng.integers(0, num_keys, size=left_n, dtype=np.int64),
+        'left_vals': rng.standard_normal(out=left_vals),
+        'right_ids': rng.integers(0, num_keys, size=right_n, dtype=np.int64),
+        'right_vals': rng.standard_normal(out=right_vals),
         # GroupBy data
-        'group_keys': np.random.randint(0, num_keys, size=n, dtype=np.int64),
-        'values': np.random.randn(n).astype(np.float64),
+        'group_keys': rng.integers(0, num_keys, size=n, dtype=np.int64),
+        'values': rng.standard_normal(out=values),
         # Metadata
         'left_n': left_n,
         'right_n': right_n,
@@ -90,10 +199,36 @@ def generate_data(n, seed=42):
     }
 
 
-def benchmark_polars(data, iterations=10):
-    """Benchmark Polars operations"""
+def slice_data(master, n):
+    """Derive an n-row data set from a larger generate_data() result.
+
+    Every column is a prefix of the master column, so smaller sizes are
+    nested inside larger ones. Keys are folded into [0, n // 10) to keep
+    the same rows-per-key ratio. Columns are copied so no two sizes share
+    backing memory.
+    """
+    right_n = n // 2
+    num_keys = n // 10
+    return {
+        'left_ids': np.remainder(master['left_ids'][:n], num_keys),
+        'left_vals': master['left_vals'][:n].copy(),
+        'right_ids': np.remainder(master['right_ids'][:right_n], num_keys),
+        'right_vals': master['right_vals'][:right_n].copy(),
+        'group_keys': np.remainder(master['group_keys'][:n], num_keys),
+        'values': master['values'][:n].copy(),
+        'left_n': n,
+        'right_n': right_n,
+        'num_keys': num_keys,
+    }
+
+
+def benchmark_polars(size, iterations=10, data=None):
+    """Benchmark Polars operations, returning (library, size, results)"""
     if not HAS_POLARS:
-        return None
+        return 'polars', size, None
+
+    if data is None:
+        data = generate_data(size)
 
     # Create DataFrames
     left_df = pl.DataFrame({
@@ -111,56 +246,71 @@ def benchmark_polars(data, iterations=10):
 
     results = {'library': 'polars', 'version': pl.__version__}
 
+    # Callables are bound once here (bound methods / partials) so the timed
+    # call doesn't pay for closure lookups or expression construction
+    values = groupby_df['value']
+
     # Aggregations
-    results['sum'] = run_benchmark(
-        lambda: groupby_df['value'].sum(), iterations=iterations)
-    results['min'] = run_benchmark(
-        lambda: groupby_df['value'].min(), iterations=iterations)
-    results['max'] = run_benchmark(
-        lambda: groupby_df['value'].max(), iterations=iterations)
-    results['mean'] = run_benchmark(
-        lambda: groupby_df['value'].mean(), iterations=iterations)
+    results['sum'] = run_benchmark(values.sum, iterations=iterations)
+    results['min'] = run_benchmark(values.min, iterations=iterations)
+    results['max'] = run_benchmark(values.max, iterations=iterations)
+    results['mean'] = run_benchmark(values.mean, iterations=iterations)
 
     # Filter
-    threshold = 0.0
     results['filter'] = run_benchmark(
-        lambda: groupby_df.filter(pl.col('value') > threshold), iterations=iterations)
+        partial(groupby_df.filter, pl.col('value') > 0.0), iterations=iterations)
 
     # Sort
     results['sort'] = run_benchmark(
-        lambda: groupby_df.sort('value'), iterations=iterations)
+        partial(groupby_df.sort, 'value'), iterations=iterations)
 
     # GroupBy
+    sum_expr = pl.col('value').sum()
+    mean_expr = pl.col('value').mean()
+    multi_exprs = [
+        pl.col('value').sum().alias('sum'),
+        pl.col('value').mean().alias('mean'),
+        pl.col('value').min().alias('min'),
+        pl.col('value').max().alias('max'),
+        pl.col('value').count().alias('count'),
+    ]
     results['groupby_sum'] = run_benchmark(
-        lambda: groupby_df.group_by('key').agg(pl.col('value').sum()),
-        iterations=iterations)
+        lambda: groupby_df.group_by('key').agg(sum_expr), iterations=iterations)
     results['groupby_mean'] = run_benchmark(
-        lambda: groupby_df.group_by('key').agg(pl.col('value').mean()),
-        iterations=iterations)
+        lambda: groupby_df.group_by('key').agg(mean_expr), iterations=iterations)
     results['groupby_multi'] = run_benchmark(
-        lambda: groupby_df.group_by('key').agg([
-            pl.col('value').sum().alias('sum'),
-            pl.col('value').mean().alias('mean'),
-            pl.col('value').min().alias('min'),
-            pl.col('value').max().alias('max'),
-            pl.col('value').count().alias('count'),
-        ]), iterations=iterations)
-
-    # Joins
-    results['inner_join'] = run_benchmark(
-        lambda: left_df.join(right_df, on='id', how='inner'),
-        warmup=2, iterations=iterations)
+        lambda: groupby_df.group_by('key').agg(multi_exprs), iterations=iterations)
+
+    # Joins - time both orderings and report the faster one as inner_join,
+    # so the comparison reflects kernel speed rather than join-order quirks
+    results['inner_join_lr'] = run_benchmark(
+        partial(left_df.join, right_df, on='id', how='inner'), iterations=iterations)
+    results['inner_join_rl'] = run_benchmark(
+        partial(right_df.join, left_df, on='id', how='inner'), iterations=iterations)
+    # A copy, so inner_join isn't the same dict as one of the directions
+    results['inner_join'] = dict(min(results['inner_join_lr'], results['inner_join_rl'],
+                                     key=operator.itemgetter('median')))
     results['left_join'] = run_benchmark(
-        lambda: left_df.join(right_df, on='id', how='left'),
-        warmup=2, iterations=iterations)
+        partial(left_df.join, right_df, on='id', how='left'), iterations=iterations)
+
+    # Sorted-key join: pre-sort once and flag the key so Polars can take
+    # its sorted-merge path instead of hashing
+    left_sorted = left_df.sort('id').with_columns(pl.col('id').set_sorted())
+    right_sorted = right_df.sort('id').with_columns(pl.col('id').set_sorted())
+    results['inner_join_sorted'] = run_benchmark(
+        partial(left_sorted.join, right_sorted, on='id', how='inner'),
+        iterations=iterations)
 
-    return results
+    return 'polars', size, results
 
 
-def benchmark_pandas(data, iterations=10):
-    """Benchmark Pandas operations"""
+def benchmark_pandas(size, iterations=10, data=None):
+    """Benchmark Pandas operations, returning (library, size, results)"""
     if not HAS_PANDAS:
-        return None
+        return 'pandas', size, None
+
+    if data is None:
+        data = generate_data(size)
 
     # Create DataFrames
     left_df = pd.DataFrame({
@@ -178,24 +328,21 @@ def benchmark_pandas(data, iterations=10):
 
     results = {'library': 'pandas', 'version': pd.__version__}
 
+    values = groupby_df['value']
+
     # Aggregations
-    results['sum'] = run_benchmark(
-        lambda: groupby_df['value'].sum(), iterations=iterations)
-    results['min'] = run_benchmark(
-        lambda: groupby_df['value'].min(), iterations=iterations)
-    results['max'] = run_benchmark(
-        lambda: groupby_df['value'].max(), iterations=iterations)
-    results['mean'] = run_benchmark(
-        lambda: groupby_df['value'].mean(), iterations=iterations)
+    results['sum'] = run_benchmark(values.sum, iterations=iterations)
+    results['min'] = run_benchmark(values.min, iterations=iterations)
+    results['max'] = run_benchmark(values.max, iterations=iterations)
+    results['mean'] = run_benchmark(values.mean, iterations=iterations)
 
-    # Filter
-    threshold = 0.0
+    # Filter (the mask is part of the operation, so it is built per call)
     results['filter'] = run_benchmark(
-        lambda: groupby_df[groupby_df['value'] > threshold], iterations=iterations)
+        lambda: groupby_df[values > 0.0], iterations=iterations)
 
     # Sort
     results['sort'] = run_benchmark(
-        lambda: groupby_df.sort_values('value'), iterations=iterations)
+        partial(groupby_df.sort_values, 'value'), iterations=iterations)
 
     # GroupBy
     results['groupby_sum'] = run_benchmark(
@@ -208,35 +355,177 @@ def benchmark_pandas(data, iterations=10):
         lambda: groupby_df.groupby('key')['value'].agg(['sum', 'mean', 'min', 'max', 'count']),
         iterations=iterations)
 
-    # Joins
-    results['inner_join'] = run_benchmark(
-        lambda: pd.merge(left_df, right_df, on='id', how='inner'),
-        warmup=2, iterations=iterations)
+    # Joins - both orderings, faster one reported as inner_join
+    results['inner_join_lr'] = run_benchmark(
+        partial(pd.merge, left_df, right_df, on='id', how='inner'), iterations=iterations)
+    results['inner_join_rl'] = run_benchmark(
+        partial(pd.merge, right_df, left_df, on='id', how='inner'), iterations=iterations)
+    # A copy, so inner_join isn't the same dict as one of the directions
+    results['inner_join'] = dict(min(results['inner_join_lr'], results['inner_join_rl'],
+                                     key=operator.itemgetter('median')))
     results['left_join'] = run_benchmark(
-        lambda: pd.merge(left_df, right_df, on='id', how='left'),
-        warmup=2, iterations=iterations)
+        partial(pd.merge, left_df, right_df, on='id', how='left'), iterations=iterations)
+
+    return 'pandas', size, results
 
-    return results
 
+def benchmark_numpy_groupby(size, iterations=10, data=None):
+    """Benchmark a pure NumPy sort + segment-reduce GroupBy baseline.
 
-def run_galleon_benchmark(data, go_dir):
-    """Run Galleon benchmarks via Go test"""
-    # Save data for Go to read
-    np.save('/tmp/galleon_bench_left_ids.npy', data['left_ids'])
-    np.save('/tmp/galleon_bench_left_vals.npy', data['left_vals'])
-    np.save('/tmp/galleon_bench_right_ids.npy', data['right_ids'])
-    np.save('/tmp/galleon_bench_right_vals.npy', data['right_vals'])
-    np.save('/tmp/galleon_bench_group_keys.npy', data['group_keys'])
-    np.save('/tmp/galleon_bench_values.npy', data['values'])
+    Keys are argsorted once outside the timed region, so only the
+    np.add.reduceat segment reductions are measured.
+    """
+    if data is None:
+        data = generate_data(size)
 
-    with open('/tmp/galleon_bench_info.txt', 'w') as f:
-        f.write(f"{data['left_n']}\n")
-        f.write(f"{data['right_n']}\n")
-        f.write(f"{data['num_keys']}\n")
+    order = np.argsort(data['group_keys'], kind='stable')
+    sorted_keys = data['group_keys'][order]
+    sorted_vals = data['values'][order]
+    edges = np.concatenate(([0], np.flatnonzero(np.diff(sorted_keys)) + 1))
+    counts = np.diff(np.append(edges, len(sorted_vals)))
 
-    # Run Go benchmark (output captured from Go benchmark tool)
-    # This is a placeholder - actual Go benchmarks run separately
-    return None
+    results = {'library': 'numpy', 'version': np.__version__}
+
+    results['groupby_sum'] = run_benchmark(
+        partial(np.add.reduceat, sorted_vals, edges), iterations=iterations)
+    results['groupby_mean'] = run_benchmark(
+        lambda: np.add.reduceat(sorted_vals, edges) / counts,
+        iterations=iterations)
+
+    return 'numpy', size, results
+
+
+if HAS_NUMBA:
+    @numba.njit(parallel=True, cache=True, fastmath=True)
+    def _numba_groupby_sum_count(keys, values, n_groups, out_sum, out_count, n_threads):
+        """Per-thread scratch accumulation followed by a column-sum reduction
+
+        n_threads is passed in (not read via numba.get_num_threads() inside)
+        so the kernel has no dynamic globals and cache=True takes effect.
+        """
+        n = len(keys)
+        chunk = (n + n_threads - 1) // n_threads
+        scratch_sum = np.zeros((n_threads, n_groups), dtype=np.float64)
+        scratch_count = np.zeros((n_threads, n_groups), dtype=np.int64)
+
+        for t in numba.prange(n_threads):
+            for i in range(t * chunk, min((t + 1) * chunk, n)):
+                k = keys[i]
+                scratch_sum[t, k] += values[i]
+                scratch_count[t, k] += 1
+
+        for g in numba.prange(n_groups):
+            total = 0.0
+            count = 0
+            for t in range(n_threads):
+                total += scratch_sum[t, g]
+                count += scratch_count[t, g]
+            out_sum[g] = total
+            out_count[g] = count
+
+    # Compile (or load from the on-disk cache) once, at import, on tiny
+    # fixed arrays of the same types the benchmark uses
+    _numba_groupby_sum_count(np.array([0, 1, 0], dtype=np.int64), np.array([1.0, 2.0, 3.0]), 2,
+                             np.empty(2), np.empty(2, dtype=np.int64), 1)
+
+
+def benchmark_numba_groupby(size, iterations=10, data=None):
+    """Benchmark a hand-written parallel Numba GroupBy kernel"""
+    if not HAS_NUMBA:
+        return 'numba', size, None
+
+    if data is None:
+        data = generate_data(size)
+    keys = data['group_keys']
+    values = data['values']
+    n_groups = data['num_keys']
+    out_sum = np.empty(n_groups, dtype=np.float64)
+    out_count = np.empty(n_groups, dtype=np.int64)
+    n_threads = numba.get_num_threads()
+
+    def groupby_sum():
+        _numba_groupby_sum_count(keys, values, n_groups, out_sum, out_count, n_threads)
+        return out_sum
+
+    def groupby_mean():
+        _numba_groupby_sum_count(keys, values, n_groups, out_sum, out_count, n_threads)
+        # Keys not present in the data leave empty groups; their mean is NaN
+        return np.divide(out_sum, out_count, out=np.full(n_groups, np.nan),
+                         where=out_count > 0)
+
+    results = {'library': 'numba', 'version': numba.__version__}
+    results['groupby_sum'] = run_benchmark(groupby_sum, iterations=iterations)
+    results['groupby_mean'] = run_benchmark(groupby_mean, iterations=iterations)
+
+    return 'numba', size, results
+
+
+def _pin_worker(counter, verbose_timings=False):
+    """Worker initializer: pin this process to a single CPU core"""
+    # Spawned workers re-import this module, so carry the flag over
+    global VERBOSE_TIMINGS
+    VERBOSE_TIMINGS = verbose_timings
+    if not hasattr(os, 'sched_setaffinity'):
+        return
+    with counter.get_lock():
+        slot = counter.value
+        counter.value += 1
+    cores = sorted(os.sched_getaffinity(0))
+    os.sched_setaffinity(0, {cores[slot % len(cores)]})
+
+
+def run_parallel(tasks, iterations, datasets):
+    """Run (benchmark_func, size) tasks in pinned worker processes.
+
+    Workers are spawned (not forked) so WORKER_ENV is in place before they
+    import Polars. Each task is sent its own datasets[size]. Returns
+    results in completion order.
+    """
+    ctx = multiprocessing.get_context('spawn')
+    counter = ctx.Value('i', 0)
+    max_workers = min(len(tasks), os.cpu_count() or 1)
+
+    saved_env = {key: os.environ.get(key) for key in WORKER_ENV}
+    os.environ.update(WORKER_ENV)
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=ctx,
+                                 initializer=_pin_worker,
+                                 initargs=(counter, VERBOSE_TIMINGS)) as pool:
+            futures = [pool.submit(func, size, iterations, datasets[size])
+                       for func, size in tasks]
+            return [future.result() for future in as_completed(futures)]
+    finally:
+        for key, value in saved_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def write_arrow_tables(data, prefix='/tmp/galleon_bench'):
+    """Write benchmark data as Arrow IPC files, one per table shape.
+
+    An IPC file holds a single schema, so the left, right and groupby
+    tables (n, n/2 and n rows) each get their own file. Row counts come
+    from the record batches; num_keys is stored in the schema metadata.
+    Returns the paths written.
+    """
+    tables = {
+        'left': {'id': data['left_ids'], 'left_val': data['left_vals']},
+        'right': {'id': data['right_ids'], 'right_val': data['right_vals']},
+        'groupby': {'key': data['group_keys'], 'value': data['values']},
+    }
+    metadata = {'num_keys': str(data['num_keys'])}
+
+    paths = []
+    for name, columns in tables.items():
+        batch = pa.RecordBatch.from_pydict(columns).replace_schema_metadata(metadata)
+        path = f"{prefix}_{name}.arrow"
+        with pa.OSFile(path, 'wb') as sink:
+            with pa.ipc.new_file(sink, batch.schema) as writer:
+                writer.write_batch(batch)
+        paths.append(path)
+    return paths
 
 
 def format_time(ms):
@@ -249,95 +538,60 @@ def format_time(ms):
         return f"{ms/1000:.2f}s"
 
 
+def _build_rows(size_results):
+    """Format one size's results into (operation, *library times, speedup) rows"""
+    lib_results = [size_results.get(lib) or {} for lib in TABLE_LIBRARIES]
+    rows = []
+    for op_key, op_name in OPERATIONS:
+        times = [res.get(op_key, {}).get('median') for res in lib_results]
+        polars_time, pandas_time = times[0], times[1]
+
+        if polars_time is not None and pandas_time is not None:
+            speedup_str = f"{pandas_time / polars_time:.1f}x"
+        else:
+            speedup_str = "N/A"
+
+        time_strs = [format_time(t) if t is not None else "N/A" for t in times]
+        rows.append((op_name, *time_strs, speedup_str))
+    return rows
+
+
 def print_comparison_table(results, sizes):
     """Print formatted comparison table"""
-    operations = [
-        ('sum', 'Sum'),
-        ('min', 'Min'),
-        ('max', 'Max'),
-        ('mean', 'Mean'),
-        ('filter', 'Filter (>0)'),
-        ('sort', 'Sort'),
-        ('groupby_sum', 'GroupBy Sum'),
-        ('groupby_mean', 'GroupBy Mean'),
-        ('groupby_multi', 'GroupBy Multi'),
-        ('inner_join', 'Inner Join'),
-        ('left_join', 'Left Join'),
-    ]
-
+    header = f"{'Operation':<20}" + "".join(f" {name:>12}" for name in TABLE_HEADERS) + f" {'Speedup':>12}"
+    width = max(80, len(header))
     for size in sizes:
         if size not in results:
             continue
 
-        size_results = results[size]
-        polars_res = size_results.get('polars', {})
-        pandas_res = size_results.get('pandas', {})
-
-        print(f"\n{'='*80}")
-        print(f"Size: {size:,} rows")
-        print(f"{'='*80}")
-        print(f"{'Operation':<20} {'Polars':>12} {'Pandas':>12} {'Speedup':>12}")
-        print(f"{'-'*80}")
-
-        for op_key, op_name in operations:
-            polars_time = polars_res.get(op_key, {}).get('median', float('inf'))
-            pandas_time = pandas_res.get(op_key, {}).get('median', float('inf'))
-
-            if polars_time < float('inf') and pandas_time < float('inf'):
-                speedup = pandas_time / polars_time
-                speedup_str = f"{speedup:.1f}x"
-            else:
-                speedup_str = "N/A"
-
-            polars_str = format_time(polars_time) if polars_time < float('inf') else "N/A"
-            pandas_str = format_time(pandas_time) if pandas_time < float('inf') else "N/A"
-
-            print(f"{op_name:<20} {polars_str:>12} {pandas_str:>12} {speedup_str:>12}")
+        lines = [
+            f"\n{'='*width}",
+            f"Size: {size:,} rows",
+            f"{'='*width}",
+            header,
+            f"{'-'*width}",
+        ]
+        for op_name, *cells in _build_rows(results[size]):
+            lines.append(f"{op_name:<20}" + "".join(f" {cell:>12}" for cell in cells))
+        print("\n".join(lines))
 
 
 def generate_markdown_table(results, sizes):
     """Generate Markdown table for documentation"""
     lines = []
-
-    operations = [
-        ('sum', 'Sum'),
-        ('min', 'Min'),
-        ('max', 'Max'),
-        ('mean', 'Mean'),
-        ('filter', 'Filter'),
-        ('sort', 'Sort'),
-        ('groupby_sum', 'GroupBy Sum'),
-        ('groupby_mean', 'GroupBy Mean'),
-        ('inner_join', 'Inner Join'),
-        ('left_join', 'Left Join'),
-    ]
+    header = "| Operation | " + " | ".join(TABLE_HEADERS) + " | Polars Speedup |"
+    divider = "|" + "|".join("-" * (len(col) + 2) for col in
+                             ('Operation', *TABLE_HEADERS, 'Polars Speedup')) + "|"
 
     for size in sizes:
         if size not in results:
             continue
 
-        size_results = results[size]
-        polars_res = size_results.get('polars', {})
-        pandas_res = size_results.get('pandas', {})
-
         lines.append(f"\n### {size:,} Rows\n")
-        lines.append("| Operation | Polars | Pandas | Polars Speedup |")
-        lines.append("|-----------|--------|--------|----------------|")
-
-        for op_key, op_name in operations:
-            polars_time = polars_res.get(op_key, {}).get('median', float('inf'))
-            pandas_time = pandas_res.get(op_key, {}).get('median', float('inf'))
-
-            if polars_time < float('inf') and pandas_time < float('inf'):
-                speedup = pandas_time / polars_time
-                speedup_str = f"{speedup:.1f}x"
-            else:
-                speedup_str = "N/A"
-
-            polars_str = format_time(polars_time) if polars_time < float('inf') else "N/A"
-            pandas_str = format_time(pandas_time) if pandas_time < float('inf') else "N/A"
-
-            lines.append(f"| {op_name} | {polars_str} | {pandas_str} | {speedup_str} |")
+        lines.append(header)
+        lines.append(divider)
+        for row in _build_rows(results[size]):
+            lines.append("| " + " | ".join(row) + " |")
 
     return "\n".join(lines)
 
@@ -352,8 +606,20 @@ def main():
                        help='Output JSON file')
     parser.add_argument('--markdown', type=str, default='benchmark_results.md',
                        help='Output Markdown file')
+    parser.add_argument('--parallel', action='store_true',
+                       help='Run each (library, size) suite in its own pinned, '
+                            'single-threaded worker process')
+    parser.add_argument('--verbose-timings', action='store_true',
+                       help='Include every raw timing sample (all_times) in the JSON output')
+    parser.add_argument('--export-arrow', type=str, metavar='PREFIX', default=None,
+                       help='Also write each data set as Arrow IPC files '
+                            '(PREFIX_<size>_{left,right,groupby}.arrow) for external tools; '
+                            'the Go benchmarks still generate their own data')
     args = parser.parse_args()
 
+    global VERBOSE_TIMINGS
+    VERBOSE_TIMINGS = args.verbose_timings
+
     sizes = [int(s.strip()) for s in args.sizes.split(',')]
 
     print("="*80)
@@ -363,7 +629,7 @@ def main():
     print(f"Sizes: {sizes}")
     print(f"Iterations: {args.iterations}")
     if HAS_POLARS:
-        print(f"Polars version: {pl.__version__}")
+        print(f"Polars version: {pl.__version__} ({pl.thread_pool_size()} threads)")
     if HAS_PANDAS:
         print(f"Pandas version: {pd.__version__}")
     print("="*80)
@@ -373,60 +639,82 @@ def main():
             'date': datetime.now().isoformat(),
             'sizes': sizes,
             'iterations': args.iterations,
+            'parallel': args.parallel,
+            'polars_max_threads': (
+                int(WORKER_ENV['POLARS_MAX_THREADS']) if args.parallel
+                else pl.thread_pool_size()
+            ) if HAS_POLARS else None,
             'polars_version': pl.__version__ if HAS_POLARS else None,
             'pandas_version': pd.__version__ if HAS_PANDAS else None,
+            'numpy_version': np.__version__,
+            'numba_version': numba.__version__ if HAS_NUMBA else None,
         },
         'results': {}
     }
 
-    for size in sizes:
-        print(f"\n{'='*80}")
-        print(f"Benchmarking size: {size:,} rows")
-        print("="*80)
-
-        print("Generating data...")
-        data = generate_data(size)
-        print(f"  Left table:  {data['left_n']:,} rows")
-        print(f"  Right table: {data['right_n']:,} rows")
-        print(f"  Unique keys: {data['num_keys']:,}")
-
-        size_results = {}
+    # Generate the largest data set once; smaller sizes are prefixes of it
+    master = generate_data(max(sizes))
+    datasets = {size: slice_data(master, size) for size in sizes}
+    del master
 
+    print("\nData sets:")
+    for size in sizes:
+        print(f"  {size:,} rows: left={size:,}, right={size // 2:,}, keys={size // 10:,}")
+        all_results['results'][size] = {}
+
+    # Export the same data sets as Arrow IPC files for external consumers.
+    # Nothing in this tree reads them yet: the Go runner generates its own data.
+    if args.export_arrow:
+        if HAS_PYARROW:
+            print("\nArrow IPC exports:")
+            for size in sizes:
+                for path in write_arrow_tables(datasets[size], prefix=f"{args.export_arrow}_{size}"):
+                    print(f"  {path}")
+        else:
+            print("Warning: PyArrow not installed, cannot export Arrow IPC files")
+
+    tasks = []
+    for size in sizes:
         if HAS_POLARS:
-            print("\nRunning Polars benchmarks...")
-            polars_results = benchmark_polars(data, iterations=args.iterations)
-            size_results['polars'] = polars_results
-            print(f"  Inner Join: {polars_results['inner_join']['median']:.2f}ms")
-            print(f"  Left Join:  {polars_results['left_join']['median']:.2f}ms")
-            print(f"  GroupBy Sum: {polars_results['groupby_sum']['median']:.2f}ms")
-
+            tasks.append((benchmark_polars, size))
         if HAS_PANDAS:
-            print("\nRunning Pandas benchmarks...")
-            pandas_results = benchmark_pandas(data, iterations=args.iterations)
-            size_results['pandas'] = pandas_results
-            print(f"  Inner Join: {pandas_results['inner_join']['median']:.2f}ms")
-            print(f"  Left Join:  {pandas_results['left_join']['median']:.2f}ms")
-            print(f"  GroupBy Sum: {pandas_results['groupby_sum']['median']:.2f}ms")
-
-        all_results['results'][size] = size_results
+            tasks.append((benchmark_pandas, size))
+        tasks.append((benchmark_numpy_groupby, size))
+        if HAS_NUMBA:
+            tasks.append((benchmark_numba_groupby, size))
+
+    if args.parallel and tasks:
+        print(f"\nRunning {len(tasks)} benchmark suites in parallel (1 thread per worker)...")
+        completed = run_parallel(tasks, args.iterations, datasets)
+    else:
+        completed = (func(size, iterations=args.iterations, data=datasets[size])
+                     for func, size in tasks)
+
+    for library, size, results in completed:
+        all_results['results'][size][library] = results
+        print(f"\n{library.title()} @ {size:,} rows:")
+        for op_key, op_name in (('inner_join', 'Inner Join: '),
+                                ('left_join', 'Left Join:  '),
+                                ('groupby_sum', 'GroupBy Sum:')):
+            if op_key in results:
+                print(f"  {op_name} {results[op_key]['median']:.2f}ms")
+        if 'inner_join_lr' in results:
+            lr_faster = results['inner_join_lr']['median'] <= results['inner_join_rl']['median']
+            print(f"  Faster join order: {'left x right' if lr_faster else 'right x left'}")
 
     # Print comparison tables
     print_comparison_table(all_results['results'], sizes)
 
-    # Save JSON results
+    # Save JSON results (NumPy arrays/scalars are serialized natively by
+    # orjson; the stdlib fallback converts them via .tolist())
     output_path = Path(args.output)
-    with open(output_path, 'w') as f:
-        # Convert numpy types for JSON serialization
-        def convert(obj):
-            if isinstance(obj, np.ndarray):
-                return obj.tolist()
-            elif isinstance(obj, (np.int64, np.int32)):
-                return int(obj)
-            elif isinstance(obj, (np.float64, np.float32)):
-                return float(obj)
-            return obj
-
-        json.dump(all_results, f, indent=2, default=convert)
+    if HAS_ORJSON:
+        output_path.write_bytes(orjson.dumps(
+            all_results,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, 'w') as f:
+            json.dump(all_results, f, indent=2, default=lambda obj: obj.tolist())
     print(f"\nResults saved to {output_path}")
 
     # Generate Markdown
@@ -605,36 +605,39 @@ func BenchmarkAll_LeftJoin(b *testing.B) {
 // ============================================================================
 
 func TestOutputBenchmarkJSON(t *testing.T) {
-	// This test outputs JSON that Python can parse
+	// This test outputs NDJSON (one result object per line) that Python can
+	// parse line by line
 	if os.Getenv("BENCHMARK_JSON") != "1" {
 		t.Skip("Set BENCHMARK_JSON=1 to run")
 	}
 
-	results := runAllBenchmarks()
-	jsonBytes, err := json.MarshalIndent(results, "", "  ")
-	if err != nil {
-		t.Fatal(err)
-	}
-	fmt.Println(string(jsonBytes))
+	// Each result is written as soon as it is measured so the reader sees
+	// progress while the run is still going
+	enc := json.NewEncoder(os.Stdout)
+	runAllBenchmarks(func(result BenchResult) {
+		if err := enc.Encode(result); err != nil {
+			t.Fatal(err)
+		}
+	})
 }
 
-func runAllBenchmarks() []BenchResult {
-	var results []BenchResult
-
+// runAllBenchmarks measures every operation and passes each result to emit
+// as soon as it is available.
+func runAllBenchmarks(emit func(BenchResult)) {
 	// Core aggregations
 	for _, size := range sizes {
 		data := makeRandomF64(size, SEED)
 
-		results = append(results, benchmarkOp("Sum", "Aggregation", size, func() {
+		emit(benchmarkOp("Sum", "Aggregation", size, func() {
 			galleon.SumF64(data)
 		}))
-		results = append(results, benchmarkOp("Mean", "Aggregation", size, func() {
+		emit(benchmarkOp("Mean", "Aggregation", size, func() {
 			galleon.MeanF64(data)
 		}))
-		results = append(results, benchmarkOp("Min", "Aggregation", size, func() {
+		emit(benchmarkOp("Min", "Aggregation", size, func() {
 			galleon.MinF64(data)
 		}))
-		results = append(results, benchmarkOp("Max", "Aggregation", size, func() {
+		emit(benchmarkOp("Max", "Aggregation", size, func() {
 			galleon.MaxF64(data)
 		}))
 	}
@@ -643,16 +646,16 @@ func runAllBenchmarks() []BenchResult {
 	for _, size := range sizes {
 		data := makeRandomF64(size, SEED)
 
-		results = append(results, benchmarkOp("Median", "Statistics", size, func() {
+		emit(benchmarkOp("Median", "Statistics", size, func() {
 			galleon.MedianF64(data)
 		}))
-		results = append(results, benchmarkOp("Quantile (0.95)", "Statistics", size, func() {
+		emit(benchmarkOp("Quantile (0.95)", "Statistics", size, func() {
 			galleon.QuantileF64(data, 0.95)
 		}))
-		results = append(results, benchmarkOp("Variance", "Statistics", size, func() {
+		emit(benchmarkOp("Variance", "Statistics", size, func() {
 			galleon.VarianceF64(data)
 		}))
-		results = append(results, benchmarkOp("StdDev", "Statistics", size, func() {
+		emit(benchmarkOp("StdDev", "Statistics", size, func() {
 			galleon.StdDevF64(data)
 		}))
 	}
@@ -662,13 +665,13 @@ func runAllBenchmarks() []BenchResult {
 		dataF64 := makeRandomF64(size, SEED)
 		dataI64 := makeRandomI64(size, SEED)
 
-		results = append(results, benchmarkOp("Sort F64", "Sorting", size, func() {
+		emit(benchmarkOp("Sort F64", "Sorting", size, func() {
 			galleon.SortF64(dataF64, true)
 		}))
-		results = append(results, benchmarkOp("Argsort F64", "Sorting", size, func() {
+		emit(benchmarkOp("Argsort F64", "Sorting", size, func() {
 			galleon.ArgsortF64(dataF64, true)
 		}))
-		results = append(results, benchmarkOp("Sort I64", "Sorting", size, func() {
+		emit(benchmarkOp("Sort I64", "Sorting", size, func() {
 			galleon.SortI64(dataI64, true)
 		}))
 	}
@@ -679,23 +682,23 @@ func runAllBenchmarks() []BenchResult {
 		b := makeRandomF64(size, SEED+1)
 		out := make([]float64, size)
 
-		results = append(results, benchmarkOp("Add", "Arithmetic", size, func() {
+		emit(benchmarkOp("Add", "Arithmetic", size, func() {
 			galleon.AddF64(a, b, out)
 		}))
-		results = append(results, benchmarkOp("Mul", "Arithmetic", size, func() {
+		emit(benchmarkOp("Mul", "Arithmetic", size, func() {
 			galleon.MulF64(a, b, out)
 		}))
-		results = append(results, benchmarkOp("Div", "Arithmetic", size, func() {
+		emit(benchmarkOp("Div", "Arithmetic", size, func() {
 			galleon.DivF64(a, b, out)
 		}))
 
 		// Scalar ops need copy since they're in-place
 		dataCopy := make([]float64, size)
-		results = append(results, benchmarkOp("Add Scalar", "Arithmetic", size, func() {
+		emit(benchmarkOp("Add Scalar", "Arithmetic", size, func() {
 			copy(dataCopy, a)
 			galleon.AddScalarF64(dataCopy, 42.0)
 		}))
-		results = append(results, benchmarkOp("Mul Scalar", "Arithmetic", size, func() {
+		emit(benchmarkOp("Mul Scalar", "Arithmetic", size, func() {
 			copy(dataCopy, a)
 			galleon.MulScalarF64(dataCopy, 2.5)
 		}))
@@ -707,10 +710,10 @@ func runAllBenchmarks() []BenchResult {
 		c := make([]float64, size)
 		out := make([]byte, size)
 
-		results = append(results, benchmarkOp("CmpGt", "Comparison", size, func() {
+		emit(benchmarkOp("CmpGt", "Comparison", size, func() {
 			galleon.CmpGtF64(a, c, out)
 		}))
-		results = append(results, benchmarkOp("FilterGt (indices)", "Comparison", size, func() {
+		emit(benchmarkOp("FilterGt (indices)", "Comparison", size, func() {
 			galleon.FilterGreaterThanF64(a, 0.0)
 		}))
 	}
@@ -722,24 +725,24 @@ func runAllBenchmarks() []BenchResult {
 		data := makeRandomF64(size, SEED)
 		out := make([]float64, size)
 
-		results = append(results, benchmarkOp("Rolling Sum", "Window", size, func() {
+		emit(benchmarkOp("Rolling Sum", "Window", size, func() {
 			galleon.RollingSumF64(data, window, minPeriods, out)
 		}))
-		results = append(results, benchmarkOp("Rolling Mean", "Window", size, func() {
+		emit(benchmarkOp("Rolling Mean", "Window", size, func() {
 			galleon.RollingMeanF64(data, window, minPeriods, out)
 		}))
-		results = append(results, benchmarkOp("Rolling Min", "Window", size, func() {
+		emit(benchmarkOp("Rolling Min", "Window", size, func() {
 			galleon.RollingMinF64(data, window, minPeriods, out)
 		}))
-		results = append(results, benchmarkOp("Rolling Max", "Window", size, func() {
+		emit(benchmarkOp("Rolling Max", "Window", size, func() {
 			galleon.RollingMaxF64(data, window, minPeriods, out)
 		}))
-		results = append(results, benchmarkOp("Diff", "Window", size, func() {
+		emit(benchmarkOp("Diff", "Window", size, func() {
 			galleon.DiffF64(data, 0.0, out)
 		}))
 
 		outRank := make([]uint32, size)
-		results = append(results, benchmarkOp("Rank", "Window", size, func() {
+		emit(benchmarkOp("Rank", "Window", size, func() {
 			galleon.RankF64(data, outRank)
 		}))
 	}
@@ -750,13 +753,13 @@ func runAllBenchmarks() []BenchResult {
 		b := makeRandomF64(size, SEED+1)
 		out := make([]float64, size)
 
-		results = append(results, benchmarkOp("Sum Horizontal", "Fold", size, func() {
+		emit(benchmarkOp("Sum Horizontal", "Fold", size, func() {
 			galleon.SumHorizontal2F64(a, b, out)
 		}))
-		results = append(results, benchmarkOp("Min Horizontal", "Fold", size, func() {
+		emit(benchmarkOp("Min Horizontal", "Fold", size, func() {
 			galleon.MinHorizontal2F64(a, b, out)
 		}))
-		results = append(results, benchmarkOp("Max Horizontal", "Fold", size, func() {
+		emit(benchmarkOp("Max Horizontal", "Fold", size, func() {
 			galleon.MaxHorizontal2F64(a, b, out)
 		}))
 	}
@@ -774,13 +777,13 @@ func runAllBenchmarks() []BenchResult {
 		valSeries := galleon.NewSeriesF64("value", values)
 		df := galleon.FromColumns(keySeries, valSeries)
 
-		results = append(results, benchmarkOp("GroupBy Sum", "GroupBy", size, func() {
+		emit(benchmarkOp("GroupBy Sum", "GroupBy", size, func() {
 			_ = df.GroupBy("key").Sum("value")
 		}))
-		results = append(results, benchmarkOp("GroupBy Mean", "GroupBy", size, func() {
+		emit(benchmarkOp("GroupBy Mean", "GroupBy", size, func() {
 			_ = df.GroupBy("key").Mean("value")
 		}))
-		results = append(results, benchmarkOp("GroupBy Count", "GroupBy", size, func() {
+		emit(benchmarkOp("GroupBy Count", "GroupBy", size, func() {
 			_ = df.GroupBy("key").Count()
 		}))
 	}
@@ -801,15 +804,13 @@ func runAllBenchmarks() []BenchResult {
 		rightValS := galleon.NewSeriesF64("right_val", rightValues)
 		rightDf := galleon.FromColumns(rightKeyS, rightValS)
 
-		results = append(results, benchmarkOp("Inner Join", "Join", size, func() {
+		emit(benchmarkOp("Inner Join", "Join", size, func() {
 			_ = galleon.InnerJoin(leftDf, rightDf, "key", "key")
 		}))
-		results = append(results, benchmarkOp("Left Join", "Join", size, func() {
+		emit(benchmarkOp("Left Join", "Join", size, func() {
 			_ = galleon.LeftJoin(leftDf, rightDf, "key", "key")
 		}))
 	}
-
-	return results
 }
 
 func benchmarkOp(name, category string, size int, fn func()) BenchResult {
@@ -10,11 +10,25 @@ Usage: python3 benchmark_comparison.py [--sizes 100000,1000000]
 
 import subprocess
 import json
+import math
+import gc
 import time
+import timeit
 import sys
 import os
+import signal
+import tempfile
+import threading
 import argparse
-from typing import Dict, List, Optional, Tuple
+import multiprocessing
+import operator
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import partial
+from statistics import fmean
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
@@ -33,6 +47,20 @@ except ImportError:
     HAS_PANDAS = False
     print("Warning: Pandas not installed")
 
+try:
+    from scipy.ndimage import uniform_filter1d, minimum_filter1d, maximum_filter1d
+    import scipy
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+    print("Warning: SciPy not installed, skipping rolling-window baseline")
+
+# Faster NDJSON parsing of Galleon results when available
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 # ============================================================================
 # Configuration
 # ============================================================================
@@ -40,39 +68,83 @@ except ImportError:
 SEED = 42
 DEFAULT_SIZES = [100_000, 1_000_000]
 ITERATIONS = 5
-WARMUP = 2
 WINDOW_SIZE = 100
 
+# Go package directory inside the benchmark container, and where the
+# pre-built benchmark test binary is written
+GO_DIR = '/galleon/go'
+GALLEON_BENCH_BINARY = '/tmp/galleon_bench'
+
+# Adaptive warmup: stop once the relative 95% confidence-interval width
+# (RCIW) of the last WARMUP_WINDOW calls falls below WARMUP_RCIW
+WARMUP_WINDOW = 5
+WARMUP_RCIW = 0.05
+WARMUP_MAX = 30
+
+# Thread limits exported to --parallel workers so concurrent suites don't
+# oversubscribe the cores they are pinned to
+WORKER_ENV = {'OMP_NUM_THREADS': '1', 'POLARS_MAX_THREADS': '1'}
+
 # ============================================================================
 # Utility Functions
 # ============================================================================
 
-def benchmark(func, iterations=ITERATIONS, warmup=WARMUP):
-    """Run benchmark with warmup iterations."""
-    for _ in range(warmup):
+def warmup_until_stable(func, max_warmup: int = WARMUP_MAX) -> int:
+    """Call func until its timings stabilize; return the number of calls."""
+    window = deque(maxlen=WARMUP_WINDOW)
+    calls = 0
+    while calls < max_warmup:
+        start = time.perf_counter_ns()
         func()
-
-    times = []
-    for _ in range(iterations):
-        start = time.perf_counter()
-        func()
-        elapsed = time.perf_counter() - start
-        times.append(elapsed)
-
-    return np.mean(times) * 1000  # Return mean in ms
+        window.append(time.perf_counter_ns() - start)
+        calls += 1
+
+        if len(window) == WARMUP_WINDOW:
+            w = np.asarray(window)
+            median = np.median(w)
+            if median > 0:
+                rciw = (np.percentile(w, 97.5) - np.percentile(w, 2.5)) / median
+                if rciw < WARMUP_RCIW:
+                    break
+    return calls
+
+def benchmark(func, iterations=ITERATIONS, max_warmup=WARMUP_MAX):
+    """Run benchmark after an adaptive warmup."""
+    warmup_until_stable(func, max_warmup)
+
+    # autorange() picks a loop count that amortizes call overhead per sample
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    gc_was_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        raw = timer.repeat(repeat=iterations, number=number)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    # Reclaim the discarded results here, outside the measured region
+    gc.collect()
+
+    # One division on the mean instead of a per-sample list plus np.mean
+    return fmean(raw) / number * 1000  # Return mean in ms
+
+# format_time unit table: values below _TIME_BOUNDS[i] (in ms) use
+# _TIME_UNITS[i] as (scale, format spec, suffix)
+_TIME_BOUNDS = (0.001, 1, 1000)
+_TIME_UNITS = (
+    (1000, '.1f', ' us'),
+    (1000, '.0f', ' us'),
+    (1, '.2f', ' ms'),
+    (0.001, '.2f', ' s'),
+)
 
 def format_time(ms: Optional[float]) -> str:
     """Format time with appropriate units."""
     if ms is None:
         return "N/A"
-    if ms < 0.001:
-        return f"{ms*1000:.1f} us"
-    elif ms < 1:
-        return f"{ms*1000:.0f} us"
-    elif ms < 1000:
-        return f"{ms:.2f} ms"
-    else:
-        return f"{ms/1000:.2f} s"
+    scale, spec, suffix = _TIME_UNITS[bisect_right(_TIME_BOUNDS, ms)]
+    return f"{ms * scale:{spec}}{suffix}"
 
 def format_speedup(galleon_ms: Optional[float], other_ms: Optional[float]) -> str:
     """Calculate and format speedup."""
@@ -88,261 +160,432 @@ def format_speedup(galleon_ms: Optional[float], other_ms: Optional[float]) -> st
 
 def generate_data(n: int, seed: int = SEED) -> Dict:
     """Generate test data matching Go benchmarks exactly."""
-    np.random.seed(seed)
+    # PCG64 generator, filling preallocated buffers in place
+    rng = np.random.default_rng(seed)
+    float64 = np.empty(n, dtype=np.float64)
+    float64_2 = np.empty(n, dtype=np.float64)
+    rng.standard_normal(out=float64)
+    float64 *= 100
+    rng.standard_normal(out=float64_2)
+    float64_2 *= 100
     return {
-        'float64': np.random.randn(n) * 100,
-        'float64_2': np.random.randn(n) * 100,
-        'int64': np.random.randint(0, 1000000, n, dtype=np.int64),
-        'group_keys': np.random.randint(0, max(10, n // 100), n, dtype=np.int64),
+        'float64': float64,
+        'float64_2': float64_2,
+        'int64': rng.integers(0, 1000000, n, dtype=np.int64),
+        'group_keys': rng.integers(0, max(10, n // 100), n, dtype=np.int64),
     }
 
 # ============================================================================
 # Polars Benchmarks
 # ============================================================================
 
+@dataclass
+class Fixtures:
+    """Series and DataFrames built once per size, shared by every benchmark."""
+    s: Any
+    s2: Any
+    df_fold: Any
+    df_groupby: Any
+    left_df: Any
+    right_df: Any
+
+def _join_data(size: int) -> Tuple[Dict, Dict]:
+    """Left (size rows) and right (size // 10 rows) join inputs."""
+    return generate_data(size), generate_data(size // 10, seed=SEED+1)
+
+def _build_polars_fixtures(data: Dict, right_data: Dict) -> Fixtures:
+    """Construct all Polars inputs once, outside any timed region."""
+    return Fixtures(
+        s=pl.Series(data['float64']),
+        s2=pl.Series(data['float64_2']),
+        df_fold=pl.DataFrame({'a': data['float64'], 'b': data['float64_2']}),
+        df_groupby=pl.DataFrame({'key': data['group_keys'], 'value': data['float64']}),
+        left_df=pl.DataFrame({'key': data['int64'], 'left_val': data['float64']}),
+        right_df=pl.DataFrame({'key': right_data['int64'], 'right_val': right_data['float64']}),
+    )
+
+def benchmark_polars_size(size: int) -> Tuple[str, int, Dict[Tuple[str, int], float]]:
+    """Run all Polars benchmarks for one size, returning (library, size, results)."""
+    results = {}
+
+    fx = _build_polars_fixtures(*_join_data(size))
+    s, s2 = fx.s, fx.s2
+
+    # Core Aggregations
+    results[('Sum', size)] = benchmark(s.sum)
+    results[('Mean', size)] = benchmark(s.mean)
+    results[('Min', size)] = benchmark(s.min)
+    results[('Max', size)] = benchmark(s.max)
+
+    # Statistics
+    results[('Median', size)] = benchmark(s.median)
+    results[('Quantile (0.95)', size)] = benchmark(partial(s.quantile, 0.95))
+    results[('Variance', size)] = benchmark(s.var)
+    results[('StdDev', size)] = benchmark(s.std)
+
+    # Sorting
+    results[('Sort F64', size)] = benchmark(s.sort)
+    results[('Argsort F64', size)] = benchmark(s.arg_sort)
+
+    # Arithmetic
+    results[('Add', size)] = benchmark(partial(operator.add, s, s2))
+    results[('Mul', size)] = benchmark(partial(operator.mul, s, s2))
+    results[('Div', size)] = benchmark(partial(operator.truediv, s, s2))
+    results[('Add Scalar', size)] = benchmark(partial(operator.add, s, 42.0))
+    results[('Mul Scalar', size)] = benchmark(partial(operator.mul, s, 2.5))
+
+    # Comparisons
+    results[('CmpGt', size)] = benchmark(partial(operator.gt, s, 0))
+    results[('FilterGt (indices)', size)] = benchmark(lambda: (s > 0).arg_true())
+
+    # Window Functions
+    results[('Rolling Sum', size)] = benchmark(partial(s.rolling_sum, window_size=WINDOW_SIZE))
+    results[('Rolling Mean', size)] = benchmark(partial(s.rolling_mean, window_size=WINDOW_SIZE))
+    results[('Rolling Min', size)] = benchmark(partial(s.rolling_min, window_size=WINDOW_SIZE))
+    results[('Rolling Max', size)] = benchmark(partial(s.rolling_max, window_size=WINDOW_SIZE))
+    results[('Diff', size)] = benchmark(s.diff)
+    results[('Rank', size)] = benchmark(s.rank)
+
+    # Horizontal/Fold (using DataFrame)
+    results[('Sum Horizontal', size)] = benchmark(partial(fx.df_fold.select, pl.sum_horizontal(['a', 'b'])))
+    results[('Min Horizontal', size)] = benchmark(partial(fx.df_fold.select, pl.min_horizontal(['a', 'b'])))
+    results[('Max Horizontal', size)] = benchmark(partial(fx.df_fold.select, pl.max_horizontal(['a', 'b'])))
+
+    # GroupBy
+    df_groupby = fx.df_groupby
+    sum_expr = pl.col('value').sum()
+    mean_expr = pl.col('value').mean()
+    count_expr = pl.col('value').count()
+    results[('GroupBy Sum', size)] = benchmark(lambda: df_groupby.group_by('key').agg(sum_expr))
+    results[('GroupBy Mean', size)] = benchmark(lambda: df_groupby.group_by('key').agg(mean_expr))
+    results[('GroupBy Count', size)] = benchmark(lambda: df_groupby.group_by('key').agg(count_expr))
+
+    # Joins
+    results[('Inner Join', size)] = benchmark(partial(fx.left_df.join, fx.right_df, on='key', how='inner'))
+    results[('Left Join', size)] = benchmark(partial(fx.left_df.join, fx.right_df, on='key', how='left'))
+
+    return 'polars', size, results
+
 def benchmark_polars(sizes: List[int]) -> Dict[Tuple[str, int], float]:
     """Run all Polars benchmarks."""
     if not HAS_POLARS:
         return {}
 
     results = {}
-
     for size in sizes:
-        data = generate_data(size)
-        s = pl.Series(data['float64'])
-        s2 = pl.Series(data['float64_2'])
-
-        # Core Aggregations
-        results[('Sum', size)] = benchmark(lambda: s.sum())
-        results[('Mean', size)] = benchmark(lambda: s.mean())
-        results[('Min', size)] = benchmark(lambda: s.min())
-        results[('Max', size)] = benchmark(lambda: s.max())
-
-        # Statistics
-        results[('Median', size)] = benchmark(lambda: s.median())
-        results[('Quantile (0.95)', size)] = benchmark(lambda: s.quantile(0.95))
-        results[('Variance', size)] = benchmark(lambda: s.var())
-        results[('StdDev', size)] = benchmark(lambda: s.std())
-
-        # Sorting
-        results[('Sort F64', size)] = benchmark(lambda: s.sort())
-        results[('Argsort F64', size)] = benchmark(lambda: s.arg_sort())
-
-        # Arithmetic
-        results[('Add', size)] = benchmark(lambda: s + s2)
-        results[('Mul', size)] = benchmark(lambda: s * s2)
-        results[('Div', size)] = benchmark(lambda: s / s2)
-        results[('Add Scalar', size)] = benchmark(lambda: s + 42.0)
-        results[('Mul Scalar', size)] = benchmark(lambda: s * 2.5)
-
-        # Comparisons
-        results[('CmpGt', size)] = benchmark(lambda: s > 0)
-        results[('FilterGt (indices)', size)] = benchmark(lambda: (s > 0).arg_true())
-
-        # Window Functions
-        results[('Rolling Sum', size)] = benchmark(lambda: s.rolling_sum(window_size=WINDOW_SIZE))
-        results[('Rolling Mean', size)] = benchmark(lambda: s.rolling_mean(window_size=WINDOW_SIZE))
-        results[('Rolling Min', size)] = benchmark(lambda: s.rolling_min(window_size=WINDOW_SIZE))
-        results[('Rolling Max', size)] = benchmark(lambda: s.rolling_max(window_size=WINDOW_SIZE))
-        results[('Diff', size)] = benchmark(lambda: s.diff())
-        results[('Rank', size)] = benchmark(lambda: s.rank())
-
-        # Horizontal/Fold (using DataFrame)
-        df_fold = pl.DataFrame({'a': data['float64'], 'b': data['float64_2']})
-        results[('Sum Horizontal', size)] = benchmark(lambda: df_fold.select(pl.sum_horizontal(['a', 'b'])))
-        results[('Min Horizontal', size)] = benchmark(lambda: df_fold.select(pl.min_horizontal(['a', 'b'])))
-        results[('Max Horizontal', size)] = benchmark(lambda: df_fold.select(pl.max_horizontal(['a', 'b'])))
-
-        # GroupBy
-        df_groupby = pl.DataFrame({
-            'key': data['group_keys'],
-            'value': data['float64']
-        })
-        results[('GroupBy Sum', size)] = benchmark(lambda: df_groupby.group_by('key').agg(pl.col('value').sum()))
-        results[('GroupBy Mean', size)] = benchmark(lambda: df_groupby.group_by('key').agg(pl.col('value').mean()))
-        results[('GroupBy Count', size)] = benchmark(lambda: df_groupby.group_by('key').agg(pl.col('value').count()))
-
-        # Joins
-        right_size = size // 10
-        right_data = generate_data(right_size, seed=SEED+1)
-        left_df = pl.DataFrame({
-            'key': data['int64'],
-            'left_val': data['float64']
-        })
-        right_df = pl.DataFrame({
-            'key': right_data['int64'],
-            'right_val': right_data['float64']
-        })
-        results[('Inner Join', size)] = benchmark(lambda: left_df.join(right_df, on='key', how='inner'))
-        results[('Left Join', size)] = benchmark(lambda: left_df.join(right_df, on='key', how='left'))
-
+        results.update(benchmark_polars_size(size)[2])
     return results
 
 # ============================================================================
 # Pandas Benchmarks
 # ============================================================================
 
+def _build_pandas_fixtures(data: Dict, right_data: Dict) -> Fixtures:
+    """Construct all Pandas inputs once, outside any timed region."""
+    return Fixtures(
+        s=pd.Series(data['float64']),
+        s2=pd.Series(data['float64_2']),
+        df_fold=pd.DataFrame({'a': data['float64'], 'b': data['float64_2']}),
+        df_groupby=pd.DataFrame({'key': data['group_keys'], 'value': data['float64']}),
+        left_df=pd.DataFrame({'key': data['int64'], 'left_val': data['float64']}),
+        right_df=pd.DataFrame({'key': right_data['int64'], 'right_val': right_data['float64']}),
+    )
+
+def benchmark_pandas_size(size: int) -> Tuple[str, int, Dict[Tuple[str, int], float]]:
+    """Run all Pandas benchmarks for one size, returning (library, size, results)."""
+    results = {}
+
+    fx = _build_pandas_fixtures(*_join_data(size))
+    s, s2 = fx.s, fx.s2
+
+    # Core Aggregations
+    results[('Sum', size)] = benchmark(s.sum)
+    results[('Mean', size)] = benchmark(s.mean)
+    results[('Min', size)] = benchmark(s.min)
+    results[('Max', size)] = benchmark(s.max)
+
+    # Statistics
+    results[('Median', size)] = benchmark(s.median)
+    results[('Quantile (0.95)', size)] = benchmark(partial(s.quantile, 0.95))
+    results[('Variance', size)] = benchmark(s.var)
+    results[('StdDev', size)] = benchmark(s.std)
+
+    # Sorting
+    results[('Sort F64', size)] = benchmark(s.sort_values)
+    results[('Argsort F64', size)] = benchmark(s.argsort)
+
+    # Arithmetic
+    results[('Add', size)] = benchmark(partial(operator.add, s, s2))
+    results[('Mul', size)] = benchmark(partial(operator.mul, s, s2))
+    results[('Div', size)] = benchmark(partial(operator.truediv, s, s2))
+    results[('Add Scalar', size)] = benchmark(partial(operator.add, s, 42.0))
+    results[('Mul Scalar', size)] = benchmark(partial(operator.mul, s, 2.5))
+
+    # Comparisons
+    results[('CmpGt', size)] = benchmark(partial(operator.gt, s, 0))
+    results[('FilterGt (indices)', size)] = benchmark(lambda: np.where(s > 0)[0])
+
+    # Window Functions
+    rolling = s.rolling(WINDOW_SIZE)
+    results[('Rolling Sum', size)] = benchmark(rolling.sum)
+    results[('Rolling Mean', size)] = benchmark(rolling.mean)
+    results[('Rolling Min', size)] = benchmark(rolling.min)
+    results[('Rolling Max', size)] = benchmark(rolling.max)
+    results[('Diff', size)] = benchmark(s.diff)
+    results[('Rank', size)] = benchmark(s.rank)
+
+    # Horizontal/Fold (using DataFrame)
+    df_fold = fx.df_fold
+    results[('Sum Horizontal', size)] = benchmark(lambda: df_fold[['a', 'b']].sum(axis=1))
+    results[('Min Horizontal', size)] = benchmark(lambda: df_fold[['a', 'b']].min(axis=1))
+    results[('Max Horizontal', size)] = benchmark(lambda: df_fold[['a', 'b']].max(axis=1))
+
+    # GroupBy
+    df_groupby = fx.df_groupby
+    results[('GroupBy Sum', size)] = benchmark(lambda: df_groupby.groupby('key')['value'].sum())
+    results[('GroupBy Mean', size)] = benchmark(lambda: df_groupby.groupby('key')['value'].mean())
+    results[('GroupBy Count', size)] = benchmark(lambda: df_groupby.groupby('key')['value'].count())
+
+    # Joins
+    results[('Inner Join', size)] = benchmark(partial(fx.left_df.merge, fx.right_df, on='key', how='inner'))
+    results[('Left Join', size)] = benchmark(partial(fx.left_df.merge, fx.right_df, on='key', how='left'))
+
+    return 'pandas', size, results
+
 def benchmark_pandas(sizes: List[int]) -> Dict[Tuple[str, int], float]:
     """Run all Pandas benchmarks."""
     if not HAS_PANDAS:
         return {}
 
     results = {}
-
     for size in sizes:
-        data = generate_data(size)
-        s = pd.Series(data['float64'])
-        s2 = pd.Series(data['float64_2'])
-
-        # Core Aggregations
-        results[('Sum', size)] = benchmark(lambda: s.sum())
-        results[('Mean', size)] = benchmark(lambda: s.mean())
-        results[('Min', size)] = benchmark(lambda: s.min())
-        results[('Max', size)] = benchmark(lambda: s.max())
-
-        # Statistics
-        results[('Median', size)] = benchmark(lambda: s.median())
-        results[('Quantile (0.95)', size)] = benchmark(lambda: s.quantile(0.95))
-        results[('Variance', size)] = benchmark(lambda: s.var())
-        results[('StdDev', size)] = benchmark(lambda: s.std())
-
-        # Sorting
-        results[('Sort F64', size)] = benchmark(lambda: s.sort_values())
-        results[('Argsort F64', size)] = benchmark(lambda: s.argsort())
-
-        # Arithmetic
-        results[('Add', size)] = benchmark(lambda: s + s2)
-        results[('Mul', size)] = benchmark(lambda: s * s2)
-        results[('Div', size)] = benchmark(lambda: s / s2)
-        results[('Add Scalar', size)] = benchmark(lambda: s + 42.0)
-        results[('Mul Scalar', size)] = benchmark(lambda: s * 2.5)
-
-        # Comparisons
-        results[('CmpGt', size)] = benchmark(lambda: s > 0)
-        results[('FilterGt (indices)', size)] = benchmark(lambda: np.where(s > 0)[0])
-
-        # Window Functions
-        results[('Rolling Sum', size)] = benchmark(lambda: s.rolling(WINDOW_SIZE).sum())
-        results[('Rolling Mean', size)] = benchmark(lambda: s.rolling(WINDOW_SIZE).mean())
-        results[('Rolling Min', size)] = benchmark(lambda: s.rolling(WINDOW_SIZE).min())
-        results[('Rolling Max', size)] = benchmark(lambda: s.rolling(WINDOW_SIZE).max())
-        results[('Diff', size)] = benchmark(lambda: s.diff())
-        results[('Rank', size)] = benchmark(lambda: s.rank())
-
-        # Horizontal/Fold (using DataFrame)
-        df_fold = pd.DataFrame({'a': data['float64'], 'b': data['float64_2']})
-        results[('Sum Horizontal', size)] = benchmark(lambda: df_fold[['a', 'b']].sum(axis=1))
-        results[('Min Horizontal', size)] = benchmark(lambda: df_fold[['a', 'b']].min(axis=1))
-        results[('Max Horizontal', size)] = benchmark(lambda: df_fold[['a', 'b']].max(axis=1))
-
-        # GroupBy
-        df_groupby = pd.DataFrame({
-            'key': data['group_keys'],
-            'value': data['float64']
-        })
-        results[('GroupBy Sum', size)] = benchmark(lambda: df_groupby.groupby('key')['value'].sum())
-        results[('GroupBy Mean', size)] = benchmark(lambda: df_groupby.groupby('key')['value'].mean())
-        results[('GroupBy Count', size)] = benchmark(lambda: df_groupby.groupby('key')['value'].count())
-
-        # Joins
-        right_size = size // 10
-        right_data = generate_data(right_size, seed=SEED+1)
-        left_df = pd.DataFrame({
-            'key': data['int64'],
-            'left_val': data['float64']
-        })
-        right_df = pd.DataFrame({
-            'key': right_data['int64'],
-            'right_val': right_data['float64']
-        })
-        results[('Inner Join', size)] = benchmark(lambda: left_df.merge(right_df, on='key', how='inner'))
-        results[('Left Join', size)] = benchmark(lambda: left_df.merge(right_df, on='key', how='left'))
+        results.update(benchmark_pandas_size(size)[2])
+    return results
+
+# ============================================================================
+# SciPy Rolling-Window Baseline
+# ============================================================================
+
+def benchmark_scipy_size(size: int) -> Tuple[str, int, Dict[Tuple[str, int], float]]:
+    """Run the scipy.ndimage rolling-window baseline for one size.
+
+    These are O(n) C filters (running sum, van Herk/Gil-Werman min/max),
+    shifted by `origin` to cover the same trailing window as rolling_*.
+    They mark the floor the library rolling kernels can be measured against.
+    """
+    results = {}
+
+    values = generate_data(size)['float64']
+    filter_args = {'size': WINDOW_SIZE, 'mode': 'constant', 'cval': 0.0,
+                   'origin': (WINDOW_SIZE - 1) // 2}
+
+    results[('Rolling Sum', size)] = benchmark(
+        lambda: uniform_filter1d(values, **filter_args) * WINDOW_SIZE)
+    results[('Rolling Mean', size)] = benchmark(partial(uniform_filter1d, values, **filter_args))
+    results[('Rolling Min', size)] = benchmark(partial(minimum_filter1d, values, **filter_args))
+    results[('Rolling Max', size)] = benchmark(partial(maximum_filter1d, values, **filter_args))
+
+    return 'scipy', size, results
+
+def benchmark_scipy(sizes: List[int]) -> Dict[Tuple[str, int], float]:
+    """Run the SciPy rolling-window baseline."""
+    if not HAS_SCIPY:
+        return {}
 
+    results = {}
+    for size in sizes:
+        results.update(benchmark_scipy_size(size)[2])
     return results
 
+def print_baseline_table(sizes: List[int], baseline: Dict, polars: Dict, pandas: Dict):
+    """Print library rolling-window times next to the SciPy floor."""
+    if not baseline:
+        return
+
+    print()
+    print("=" * 100)
+    print("ROLLING WINDOW BASELINE (scipy.ndimage)")
+    print("=" * 100)
+    print()
+    print(f"{'Operation':<25}" + "".join(
+        f" | {'SciPy':>10} {'Polars':>10} {'Pandas':>10}" for _ in sizes))
+    print("-" * 100)
+    for op in ['Rolling Sum', 'Rolling Mean', 'Rolling Min', 'Rolling Max']:
+        row = f"{op:<25}"
+        for size in sizes:
+            key = (op, size)
+            cells = [format_time(r.get(key)) if r.get(key) else "N/A"
+                     for r in (baseline, polars, pandas)]
+            row += f" | {cells[0]:>10} {cells[1]:>10} {cells[2]:>10}"
+        print(row)
+    print()
+
+# ============================================================================
+# Parallel Execution
+# ============================================================================
+
+def _pin_worker(counter) -> None:
+    """Worker initializer: pin this process to a single CPU core."""
+    if not hasattr(os, 'sched_setaffinity'):
+        return
+    with counter.get_lock():
+        slot = counter.value
+        counter.value += 1
+    cores = sorted(os.sched_getaffinity(0))
+    os.sched_setaffinity(0, {cores[slot % len(cores)]})
+
+def run_parallel(tasks: List[Tuple]) -> List[Tuple[str, int, Dict]]:
+    """Run (benchmark_func, size) tasks in pinned worker processes.
+
+    Workers are spawned (not forked) so WORKER_ENV is in place before they
+    import Polars. Returns results in completion order.
+    """
+    ctx = multiprocessing.get_context('spawn')
+    counter = ctx.Value('i', 0)
+    max_workers = min(len(tasks), os.cpu_count() or 1)
+
+    saved_env = {key: os.environ.get(key) for key in WORKER_ENV}
+    os.environ.update(WORKER_ENV)
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=ctx,
+                                 initializer=_pin_worker,
+                                 initargs=(counter,)) as pool:
+            futures = [pool.submit(func, size) for func, size in tasks]
+            return [future.result() for future in as_completed(futures)]
+    finally:
+        for key, value in saved_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
 # ============================================================================
 # Galleon Benchmarks (via Go subprocess)
 # ============================================================================
 
-def run_galleon_benchmarks(sizes: List[int]) -> Dict[Tuple[str, int], float]:
-    """Run Galleon benchmarks via Go test and parse results."""
+def build_galleon_benchmarks(output: str = GALLEON_BENCH_BINARY) -> Optional[str]:
+    """Compile the Go benchmark package once into a test binary.
+
+    Running the binary directly avoids paying toolchain startup and
+    test-binary linking on every invocation. Returns the path, or None
+    if the build failed.
+    """
+    try:
+        proc = subprocess.run(
+            ['go', 'test', '-c', '-tags', 'dev', '-o', output, './benchmarks/'],
+            cwd=GO_DIR,
+            capture_output=True,
+            text=True,
+            timeout=300
+        )
+    except Exception as e:
+        print(f"Warning: Could not build Galleon benchmarks: {e}", file=sys.stderr)
+        return None
+
+    if proc.returncode != 0:
+        print(f"Warning: Galleon benchmark build failed: {proc.stderr[:500]}", file=sys.stderr)
+        return None
+    return output
+
+# Seconds the Galleon benchmark binary may run before it is killed
+GALLEON_TIMEOUT = 300
+
+def _read_ndjson_results(stream, results: Dict[Tuple[str, int], float]):
+    """Parse NDJSON benchmark lines from stream into results until EOF."""
+    for line in stream:
+        if line.startswith('{'):
+            try:
+                item = json_loads(line)
+                results[(item['operation'], item['size'])] = item['time_ms']
+            except (ValueError, KeyError):
+                # Skip it but keep draining, so the child never blocks on a full pipe
+                continue
+
+def run_galleon_benchmarks(sizes: List[int], binary: Optional[str]) -> Dict[Tuple[str, int], float]:
+    """Run the pre-built Galleon benchmark binary and parse its NDJSON output."""
     results = {}
+    if binary is None:
+        return results
 
-    # Run Go benchmarks and capture JSON output
+    # Run Go benchmarks; each result is printed as one JSON object per line,
+    # so stdout is parsed as it streams in (on a reader thread, so the
+    # deadline below still applies) and stderr is kept for diagnostics
     try:
         env = os.environ.copy()
         env['BENCHMARK_JSON'] = '1'
         env['BENCHMARK_SIZES'] = ','.join(str(s) for s in sizes)
+        with tempfile.TemporaryFile(mode='w+') as stderr_file:
+            with subprocess.Popen(
+                [binary, '-test.run', 'TestOutputBenchmarkJSON'],
+                cwd=GO_DIR,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+                bufsize=1,
+                text=True,
+                env=env,
+                # Own process group, so a timeout kills anything it started
+                # too (which would otherwise hold stdout open)
+                start_new_session=hasattr(os, 'killpg')
+            ) as proc:
+                reader = threading.Thread(target=_read_ndjson_results,
+                                          args=(proc.stdout, results), daemon=True)
+                reader.start()
+                try:
+                    returncode = proc.wait(timeout=GALLEON_TIMEOUT)
+                except subprocess.TimeoutExpired:
+                    if hasattr(os, 'killpg'):
+                        os.killpg(proc.pid, signal.SIGKILL)
+                    else:
+                        proc.kill()
+                    returncode = proc.wait()
+                    print(f"Warning: Galleon benchmarks timed out after {GALLEON_TIMEOUT}s; "
+                          f"killed with {len(results)} results", file=sys.stderr)
+                reader.join()
+
+            if returncode != 0:
+                stderr_file.seek(0)
+                stderr = stderr_file.read()
+                print(f"DEBUG: Go test failed with return code {returncode}", file=sys.stderr)
+                print(f"DEBUG: stderr: {stderr[:500] if stderr else 'empty'}", file=sys.stderr)
+    except Exception as e:
+        print(f"Warning: Could not run Galleon benchmarks: {e}", file=sys.stderr)
+
+    if results:
+        return results
+
+    # Fallback: parse standard Go benchmark output from the same binary
+    try:
         proc = subprocess.run(
-            ['go', 'test', '-tags', 'dev', '-v', '-run', 'TestOutputBenchmarkJSON', './benchmarks/'],
-            cwd='/galleon/go',
+            [binary, '-test.run', '^$', '-test.bench', 'BenchmarkAll_', '-test.benchtime', '500ms'],
+            cwd=GO_DIR,
             capture_output=True,
             text=True,
-            env=env,
             timeout=300
         )
 
-        # Parse JSON from output
-        output = proc.stdout
-
-        # Debug: print if there was an error
-        if proc.returncode != 0:
-            print(f"DEBUG: Go test failed with return code {proc.returncode}", file=sys.stderr)
-            print(f"DEBUG: stderr: {proc.stderr[:500] if proc.stderr else 'empty'}", file=sys.stderr)
-            print(f"DEBUG: stdout: {output[:500] if output else 'empty'}", file=sys.stderr)
-
-        # Find JSON array in output
-        start_idx = output.find('[')
-        end_idx = output.rfind(']') + 1
-
-        if start_idx >= 0 and end_idx > start_idx:
-            json_str = output[start_idx:end_idx]
-            data = json.loads(json_str)
-
-            for item in data:
-                key = (item['operation'], item['size'])
-                results[key] = item['time_ms']
-    except Exception as e:
-        print(f"Warning: Could not run Galleon benchmarks: {e}", file=sys.stderr)
-        # Debug: show what we tried to parse
-        if 'json_str' in dir():
-            print(f"DEBUG: json_str first 200 chars: {json_str[:200]}", file=sys.stderr)
-        if 'output' in dir():
-            print(f"DEBUG: output first 500 chars: {output[:500] if output else 'empty'}", file=sys.stderr)
-
-        # Fallback: parse standard Go benchmark output
-        try:
-            proc = subprocess.run(
-                ['go', 'test', '-tags', 'dev', '-bench', 'BenchmarkAll_', '-benchtime', '500ms', './benchmarks/'],
-                cwd='/galleon/go',
-                capture_output=True,
-                text=True,
-                timeout=300
-            )
-
-            # Parse standard benchmark output
-            for line in proc.stdout.split('\n'):
-                if line.startswith('BenchmarkAll_'):
-                    parts = line.split()
-                    if len(parts) >= 3:
-                        # Parse benchmark name and time
-                        name = parts[0].replace('BenchmarkAll_', '').replace('_', ' ')
-                        # Extract size from name like "Sum_F64/1000000"
-                        if '/' in name:
-                            name_parts = name.split('/')
-                            base_name = name_parts[0].replace('F64', '').replace('I64', '').strip()
-                            try:
-                                size = int(name_parts[1])
-                                # Find ns/op
-                                for i, p in enumerate(parts):
-                                    if 'ns/op' in p:
-                                        ns_per_op = float(parts[i-1])
-                                        results[(base_name, size)] = ns_per_op / 1_000_000
-                                        break
-                            except:
-                                pass
-        except Exception as e2:
-            print(f"Warning: Fallback benchmark parsing failed: {e2}", file=sys.stderr)
+        # Parse standard benchmark output
+        for line in proc.stdout.split('\n'):
+            if line.startswith('BenchmarkAll_'):
+                parts = line.split()
+                if len(parts) >= 3:
+                    # Parse benchmark name and time
+                    name = parts[0].replace('BenchmarkAll_', '').replace('_', ' ')
+                    # Extract size from name like "Sum_F64/1000000"
+                    if '/' in name:
+                        name_parts = name.split('/')
+                        base_name = name_parts[0].replace('F64', '').replace('I64', '').strip()
+                        try:
+                            size = int(name_parts[1].split('-')[0])
+                            # Find ns/op
+                            for i, p in enumerate(parts):
+                                if 'ns/op' in p:
+                                    ns_per_op = float(parts[i-1])
+                                    results[(base_name, size)] = ns_per_op / 1_000_000
+                                    break
+                        except ValueError:
+                            pass
+    except Exception as e2:
+        print(f"Warning: Fallback benchmark parsing failed: {e2}", file=sys.stderr)
 
     return results
 
@@ -350,6 +593,18 @@ def run_galleon_benchmarks(sizes: List[int]) -> Dict[Tuple[str, int], float]:
 # Output Formatting
 # ============================================================================
 
+def to_matrix(results: Dict[Tuple[str, int], float], operations: List[str],
+              sizes: List[int]) -> np.ndarray:
+    """Lay out {(op, size): ms} results as an (operations x sizes) array, NaN where missing."""
+    arr = np.full((len(operations), len(sizes)), np.nan)
+    op_idx = {op: i for i, op in enumerate(operations)}
+    size_idx = {size: j for j, size in enumerate(sizes)}
+    for (op, size), ms in results.items():
+        i, j = op_idx.get(op), size_idx.get(size)
+        if i is not None and j is not None and ms is not None:
+            arr[i, j] = ms
+    return arr
+
 def print_comparison_table(
     sizes: List[int],
     galleon: Dict,
@@ -392,23 +647,20 @@ def print_comparison_table(
     print()
 
     # Speedup summary
+    galleon_arr = to_matrix(galleon, operations, sizes)
+    polars_arr = to_matrix(polars, operations, sizes)
+    ratios = np.divide(galleon_arr, polars_arr, out=np.full_like(galleon_arr, np.nan),
+                       where=(galleon_arr > 0) & (polars_arr > 0))
     print("Speedup vs Polars (lower = Galleon faster):")
-    for op in operations:
-        speedups = []
-        for size in sizes:
-            key = (op, size)
-            g = galleon.get(key)
-            p = polars.get(key)
-            if g and p and p > 0:
-                speedups.append(f"{g/p:.1f}x")
-            else:
-                speedups.append("N/A")
-        print(f"  {op:<25}: {', '.join(speedups)}")
+    for op, row in zip(operations, ratios.tolist()):
+        print(f"  {op:<25}: " + ", ".join("N/A" if math.isnan(r) else f"{r:.1f}x" for r in row))
     print()
 
 def main():
     parser = argparse.ArgumentParser(description='Galleon vs Polars vs Pandas Benchmark')
     parser.add_argument('--sizes', default='100000,1000000', help='Comma-separated sizes')
+    parser.add_argument('--parallel', action='store_true',
+                        help='Run each (library, size) suite in its own pinned, single-threaded worker')
     args = parser.parse_args()
 
     sizes = [int(s) for s in args.sizes.split(',')]
@@ -426,17 +678,43 @@ def main():
         print(f"  - Polars: {pl.__version__}")
     if HAS_PANDAS:
         print(f"  - Pandas: {pd.__version__}")
+    if HAS_SCIPY:
+        print(f"  - SciPy: {scipy.__version__}")
     print()
 
     # Run benchmarks
+    print("Building Galleon benchmark binary...")
+    galleon_binary = build_galleon_benchmarks()
+
     print("Running Galleon benchmarks...")
-    galleon_results = run_galleon_benchmarks(sizes)
+    galleon_results = run_galleon_benchmarks(sizes, galleon_binary)
 
-    print("Running Polars benchmarks...")
-    polars_results = benchmark_polars(sizes)
+    if args.parallel:
+        tasks = []
+        for size in sizes:
+            if HAS_POLARS:
+                tasks.append((benchmark_polars_size, size))
+            if HAS_PANDAS:
+                tasks.append((benchmark_pandas_size, size))
+            if HAS_SCIPY:
+                tasks.append((benchmark_scipy_size, size))
+
+        print(f"Running {len(tasks)} Polars/Pandas/SciPy suites in parallel (1 thread per worker)...")
+        by_library = {'polars': {}, 'pandas': {}, 'scipy': {}}
+        for library, _, results in run_parallel(tasks) if tasks else []:
+            by_library[library].update(results)
+        polars_results = by_library['polars']
+        pandas_results = by_library['pandas']
+        scipy_results = by_library['scipy']
+    else:
+        print("Running Polars benchmarks...")
+        polars_results = benchmark_polars(sizes)
+
+        print("Running Pandas benchmarks...")
+        pandas_results = benchmark_pandas(sizes)
 
-    print("Running Pandas benchmarks...")
-    pandas_results = benchmark_pandas(sizes)
+        print("Running SciPy rolling-window baseline...")
+        scipy_results = benchmark_scipy(sizes)
 
     # Define operation categories
     categories = {
@@ -454,6 +732,7 @@ def main():
     # Print results
     for category, operations in categories.items():
         print_comparison_table(sizes, galleon_results, polars_results, pandas_results, operations, category)
+    print_baseline_table(sizes, scipy_results, polars_results, pandas_results)
 
     # Summary table (use largest size for summary)
     summary_size = max(sizes)
@@ -469,23 +748,21 @@ def main():
     for ops in categories.values():
         all_ops.extend(ops)
 
-    size = summary_size
-    galleon_wins = 0
-    polars_wins = 0
-
-    for op in all_ops:
-        key = (op, size)
-        g = galleon_results.get(key)
-        p = polars_results.get(key)
-
-        if g and p:
-            ratio = g / p
-            winner = "Galleon" if ratio < 1 else "Polars"
-            if ratio < 1:
-                galleon_wins += 1
-            else:
-                polars_wins += 1
-            print(f"{op:<30} {format_time(g):>12} {format_time(p):>12} {ratio:>11.1f}x {winner:>10}")
+    col = sizes.index(summary_size)
+    galleon_col = to_matrix(galleon_results, all_ops, sizes)[:, col]
+    polars_col = to_matrix(polars_results, all_ops, sizes)[:, col]
+    ratios = np.divide(galleon_col, polars_col, out=np.full_like(galleon_col, np.nan),
+                       where=(galleon_col > 0) & (polars_col > 0))
+    valid = ~np.isnan(ratios)
+    galleon_mask = valid & (ratios < 1)
+    galleon_wins = int(galleon_mask.sum())
+    polars_wins = int(valid.sum()) - galleon_wins
+
+    for i, op in enumerate(all_ops):
+        if valid[i]:
+            winner = "Galleon" if galleon_mask[i] else "Polars"
+            print(f"{op:<30} {format_time(galleon_col[i]):>12} {format_time(polars_col[i]):>12} "
+                  f"{ratios[i]:>11.1f}x {winner:>10}")
         else:
             print(f"{op:<30} {'N/A':>12} {'N/A':>12} {'N/A':>12} {'N/A':>10}")
 
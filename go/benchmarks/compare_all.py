@@ -4,10 +4,16 @@ Comprehensive benchmark: Galleon vs Polars vs Pandas
 Run this after running the Go benchmarks to compare.
 """
 
-import time
+import argparse
+import multiprocessing
+import operator
+import os
+from concurrent.futures import ProcessPoolExecutor
 import subprocess
 import sys
 
+from harness import benchmark_stats
+
 try:
     import polars as pl
     HAS_POLARS = True
@@ -24,167 +30,105 @@ except ImportError:
 
 import numpy as np
 
-def benchmark(func, iterations=10, warmup=2):
-    """Run benchmark with warmup iterations."""
-    for _ in range(warmup):
-        func()
-
-    times = []
-    for _ in range(iterations):
-        start = time.perf_counter()
-        func()
-        elapsed = time.perf_counter() - start
-        times.append(elapsed)
-
-    return {
-        'mean_ms': np.mean(times) * 1000,
-        'min_ms': np.min(times) * 1000,
-        'std_ms': np.std(times) * 1000,
-        'throughput_gb_s': None,  # Will be calculated per operation
-    }
-
 def format_result(result, size, bytes_per_elem=8):
     """Format benchmark result with throughput."""
     throughput = (size * bytes_per_elem) / (result['mean_ms'] / 1000) / 1e9
     return f"{result['mean_ms']:8.3f} ms | {throughput:6.1f} GB/s"
 
-def run_polars_benchmarks(sizes):
-    """Run Polars benchmarks."""
-    if not HAS_POLARS:
-        return {}
-
-    results = {}
+def to_library(library, data):
+    """Wrap a NumPy array for `library` without copying where possible."""
+    if library == 'polars':
+        return pl.Series(values=data, nan_to_null=False)
+    if library == 'pandas':
+        return pd.Series(data, copy=False)
+    return data
+
+def run_one(s1, s2, n, results):
+    """Run every operation on one library's pair of inputs.
+
+    Samples are calibrated blocks of back-to-back calls (inner=None), so
+    timer overhead doesn't swamp the sub-millisecond reductions.
+    """
+    # Reductions (ndarray, pl.Series and pd.Series all expose these methods)
+    results[('sum', n)] = benchmark_stats(s1.sum, inner=None)
+    results[('min', n)] = benchmark_stats(s1.min, inner=None)
+    results[('max', n)] = benchmark_stats(s1.max, inner=None)
+    results[('mean', n)] = benchmark_stats(s1.mean, inner=None)
+
+    # Vector operations
+    results[('add', n)] = benchmark_stats(operator.add, s1, s2, inner=None)
+    results[('mul', n)] = benchmark_stats(operator.mul, s1, s2, inner=None)
+    results[('div', n)] = benchmark_stats(operator.truediv, s1, s2, inner=None)
+
+def available_libraries():
+    """NumPy plus whichever of Polars/Pandas are installed."""
+    return ['numpy'] + [lib for lib, ok in (('polars', HAS_POLARS), ('pandas', HAS_PANDAS)) if ok]
+
+def run_all_benchmarks(sizes, libraries=None):
+    """Run all benchmarks, generating each size's data once for every library.
+
+    Returns {library: {key: result}}.
+    """
+    if libraries is None:
+        libraries = available_libraries()
+    results = {library: {} for library in libraries}
 
     for n in sizes:
-        np.random.seed(42)
-        data = np.random.randn(n)
-        df = pl.DataFrame({'value': data})
-        series = df['value']
-
-        # Sum
-        r = benchmark(lambda: series.sum())
-        results[f'sum_{n}'] = r
-
-        # Min
-        r = benchmark(lambda: series.min())
-        results[f'min_{n}'] = r
-
-        # Max
-        r = benchmark(lambda: series.max())
-        results[f'max_{n}'] = r
-
-        # Mean
-        r = benchmark(lambda: series.mean())
-        results[f'mean_{n}'] = r
-
-        # Vector operations (need two series)
-        data2 = np.random.randn(n)
-        s1 = pl.Series(data)
-        s2 = pl.Series(data2)
-
-        # Add
-        r = benchmark(lambda: s1 + s2)
-        results[f'add_{n}'] = r
-
-        # Multiply
-        r = benchmark(lambda: s1 * s2)
-        results[f'mul_{n}'] = r
+        rng = np.random.default_rng(42)
+        d1 = rng.standard_normal(n)
+        d2 = rng.standard_normal(n)
 
-        # Divide
-        r = benchmark(lambda: s1 / s2)
-        results[f'div_{n}'] = r
+        for library in libraries:
+            run_one(to_library(library, d1), to_library(library, d2), n, results[library])
 
     return results
 
-def run_pandas_benchmarks(sizes):
-    """Run Pandas benchmarks."""
-    if not HAS_PANDAS:
-        return {}
-
-    results = {}
-
-    for n in sizes:
-        np.random.seed(42)
-        data = np.random.randn(n)
-        series = pd.Series(data)
-
-        # Sum
-        r = benchmark(lambda: series.sum())
-        results[f'sum_{n}'] = r
-
-        # Min
-        r = benchmark(lambda: series.min())
-        results[f'min_{n}'] = r
-
-        # Max
-        r = benchmark(lambda: series.max())
-        results[f'max_{n}'] = r
-
-        # Mean
-        r = benchmark(lambda: series.mean())
-        results[f'mean_{n}'] = r
-
-        # Vector operations
-        data2 = np.random.randn(n)
-        s1 = pd.Series(data)
-        s2 = pd.Series(data2)
-
-        # Add
-        r = benchmark(lambda: s1 + s2)
-        results[f'add_{n}'] = r
-
-        # Multiply
-        r = benchmark(lambda: s1 * s2)
-        results[f'mul_{n}'] = r
-
-        # Divide
-        r = benchmark(lambda: s1 / s2)
-        results[f'div_{n}'] = r
-
-    return results
-
-def run_numpy_benchmarks(sizes):
-    """Run NumPy benchmarks (baseline)."""
-    results = {}
-
-    for n in sizes:
-        np.random.seed(42)
-        data = np.random.randn(n)
-
-        # Sum
-        r = benchmark(lambda: np.sum(data))
-        results[f'sum_{n}'] = r
-
-        # Min
-        r = benchmark(lambda: np.min(data))
-        results[f'min_{n}'] = r
-
-        # Max
-        r = benchmark(lambda: np.max(data))
-        results[f'max_{n}'] = r
-
-        # Mean
-        r = benchmark(lambda: np.mean(data))
-        results[f'mean_{n}'] = r
-
-        # Vector operations
-        data2 = np.random.randn(n)
-
-        # Add
-        r = benchmark(lambda: data + data2)
-        results[f'add_{n}'] = r
-
-        # Multiply
-        r = benchmark(lambda: data * data2)
-        results[f'mul_{n}'] = r
-
-        # Divide
-        r = benchmark(lambda: data / data2)
-        results[f'div_{n}'] = r
-
-    return results
+def _pin_worker(counter, n_workers):
+    """Worker initializer: pin this process to its own disjoint slice of cores."""
+    if not hasattr(os, 'sched_setaffinity'):
+        return
+    with counter.get_lock():
+        slot = counter.value
+        counter.value += 1
+    cores = sorted(os.sched_getaffinity(0))
+    os.sched_setaffinity(0, set(cores[slot::n_workers]) or {cores[slot % len(cores)]})
+
+def run_parallel(sizes, libraries=None):
+    """Run each library's suite in its own spawned process on disjoint cores.
+
+    Each worker regenerates the (seeded, identical) data for its library.
+    Polars is capped to the worker's share of cores so suites don't contend.
+    """
+    if libraries is None:
+        libraries = available_libraries()
+    ctx = multiprocessing.get_context('spawn')
+    counter = ctx.Value('i', 0)
+    n_workers = len(libraries)
+    cores_per_worker = max(1, (os.cpu_count() or 1) // n_workers)
+
+    saved = os.environ.get('POLARS_MAX_THREADS')
+    os.environ['POLARS_MAX_THREADS'] = str(cores_per_worker)
+    try:
+        with ProcessPoolExecutor(max_workers=n_workers, mp_context=ctx,
+                                 initializer=_pin_worker,
+                                 initargs=(counter, n_workers)) as pool:
+            futures = [pool.submit(run_all_benchmarks, sizes, (library,)) for library in libraries]
+            results = {}
+            for future in futures:
+                results.update(future.result())
+            return results
+    finally:
+        if saved is None:
+            os.environ.pop('POLARS_MAX_THREADS', None)
+        else:
+            os.environ['POLARS_MAX_THREADS'] = saved
 
 def main():
+    parser = argparse.ArgumentParser(description='Polars vs Pandas vs NumPy benchmark')
+    parser.add_argument('--parallel', action='store_true',
+                        help='Run each library in its own process pinned to disjoint cores')
+    args = parser.parse_args()
+
     print("=" * 80)
     print("COMPREHENSIVE BENCHMARK: Polars vs Pandas vs NumPy")
     print("=" * 80)
@@ -199,9 +143,10 @@ def main():
     print("Running benchmarks...")
     print()
 
-    numpy_results = run_numpy_benchmarks(sizes)
-    polars_results = run_polars_benchmarks(sizes) if HAS_POLARS else {}
-    pandas_results = run_pandas_benchmarks(sizes) if HAS_PANDAS else {}
+    results = run_parallel(sizes) if args.parallel else run_all_benchmarks(sizes)
+    numpy_results = results['numpy']
+    polars_results = results.get('polars', {})
+    pandas_results = results.get('pandas', {})
 
     # Print results in a table
     operations = ['sum', 'min', 'max', 'mean', 'add', 'mul', 'div']
@@ -216,7 +161,7 @@ def main():
         print("-" * 80)
 
         for op in operations:
-            key = f'{op}_{n}'
+            key = (op, n)
 
             numpy_str = format_result(numpy_results[key], n) if key in numpy_results else "N/A"
             polars_str = format_result(polars_results[key], n) if key in polars_results else "N/A"
@@ -3,30 +3,11 @@
 Benchmark comparison: Galleon (Go+Zig) vs Polars
 """
 
-import time
+from functools import partial
 import polars as pl
 import numpy as np
 
-def benchmark(func, iterations=10, warmup=2):
-    """Run benchmark with warmup iterations."""
-    # Warmup
-    for _ in range(warmup):
-        func()
-
-    # Actual benchmark
-    times = []
-    for _ in range(iterations):
-        start = time.perf_counter()
-        func()
-        elapsed = time.perf_counter() - start
-        times.append(elapsed)
-
-    return {
-        'mean': np.mean(times) * 1000,  # Convert to ms
-        'min': np.min(times) * 1000,
-        'max': np.max(times) * 1000,
-        'std': np.std(times) * 1000,
-    }
+from harness import benchmark_stats
 
 def main():
     print("=" * 70)
@@ -43,44 +24,45 @@ def main():
         print("=" * 70)
 
         # Create test data
-        np.random.seed(42)
+        rng = np.random.default_rng(42)
         num_groups = n // 10  # 10 rows per group on average
 
         df = pl.DataFrame({
-            'group_key': np.random.randint(0, num_groups, n),
-            'value_f64': np.random.randn(n),
-            'value_i64': np.random.randint(0, 1000000, n),
+            'group_key': rng.integers(0, num_groups, n),
+            'value_f64': rng.standard_normal(n),
+            'value_i64': rng.integers(0, 1000000, n),
         })
 
         # GroupBy Sum
-        result = benchmark(lambda: df.group_by('group_key').agg(pl.col('value_f64').sum()))
-        print(f"  GroupBy Sum (f64):     {result['mean']:8.3f} ms  (std: {result['std']:.3f})")
+        result = benchmark_stats(lambda: df.group_by('group_key').agg(pl.col('value_f64').sum()))
+        print(f"  GroupBy Sum (f64):     {result['mean_ms']:8.3f} ms  (std: {result['std_ms']:.3f})")
 
         # GroupBy Mean
-        result = benchmark(lambda: df.group_by('group_key').agg(pl.col('value_f64').mean()))
-        print(f"  GroupBy Mean (f64):    {result['mean']:8.3f} ms  (std: {result['std']:.3f})")
+        result = benchmark_stats(lambda: df.group_by('group_key').agg(pl.col('value_f64').mean()))
+        print(f"  GroupBy Mean (f64):    {result['mean_ms']:8.3f} ms  (std: {result['std_ms']:.3f})")
 
         # GroupBy Min
-        result = benchmark(lambda: df.group_by('group_key').agg(pl.col('value_f64').min()))
-        print(f"  GroupBy Min (f64):     {result['mean']:8.3f} ms  (std: {result['std']:.3f})")
+        result = benchmark_stats(lambda: df.group_by('group_key').agg(pl.col('value_f64').min()))
+        print(f"  GroupBy Min (f64):     {result['mean_ms']:8.3f} ms  (std: {result['std_ms']:.3f})")
 
         # GroupBy Max
-        result = benchmark(lambda: df.group_by('group_key').agg(pl.col('value_f64').max()))
-        print(f"  GroupBy Max (f64):     {result['mean']:8.3f} ms  (std: {result['std']:.3f})")
+        result = benchmark_stats(lambda: df.group_by('group_key').agg(pl.col('value_f64').max()))
+        print(f"  GroupBy Max (f64):     {result['mean_ms']:8.3f} ms  (std: {result['std_ms']:.3f})")
 
         # GroupBy Count
-        result = benchmark(lambda: df.group_by('group_key').agg(pl.col('value_f64').count()))
-        print(f"  GroupBy Count:         {result['mean']:8.3f} ms  (std: {result['std']:.3f})")
+        result = benchmark_stats(lambda: df.group_by('group_key').agg(pl.col('value_f64').count()))
+        print(f"  GroupBy Count:         {result['mean_ms']:8.3f} ms  (std: {result['std_ms']:.3f})")
 
-        # GroupBy Multiple Aggregations
-        result = benchmark(lambda: df.group_by('group_key').agg([
+        # GroupBy Multiple Aggregations - run lazily so the optimizer can
+        # evaluate all five aggregations in a single grouped pass
+        result = benchmark_stats(lambda: df.lazy().group_by('group_key').agg([
             pl.col('value_f64').sum().alias('sum'),
             pl.col('value_f64').mean().alias('mean'),
             pl.col('value_f64').min().alias('min'),
             pl.col('value_f64').max().alias('max'),
             pl.col('value_f64').count().alias('count'),
-        ]))
-        print(f"  GroupBy Multi-Agg:     {result['mean']:8.3f} ms  (std: {result['std']:.3f})")
+        ]).collect())
+        print(f"  GroupBy Multi-Agg:     {result['mean_ms']:8.3f} ms  (std: {result['std_ms']:.3f})")
 
         # Create join test data
         left_n = n
@@ -88,22 +70,35 @@ def main():
         num_keys = n // 10
 
         left_df = pl.DataFrame({
-            'id': np.random.randint(0, num_keys, left_n),
-            'left_val': np.random.randn(left_n),
+            'id': rng.integers(0, num_keys, left_n),
+            'left_val': rng.standard_normal(left_n),
         })
 
         right_df = pl.DataFrame({
-            'id': np.random.randint(0, num_keys, right_n),
-            'right_val': np.random.randn(right_n),
+            'id': rng.integers(0, num_keys, right_n),
+            'right_val': rng.standard_normal(right_n),
         })
 
-        # Inner Join
-        result = benchmark(lambda: left_df.join(right_df, on='id', how='inner'), iterations=5)
-        print(f"  Inner Join:            {result['mean']:8.3f} ms  (std: {result['std']:.3f})")
+        # Inner Join (hash)
+        result = benchmark_stats(partial(left_df.join, right_df, on='id', how='inner'))
+        print(f"  Inner Join (hash):     {result['mean_ms']:8.3f} ms  (std: {result['std_ms']:.3f})")
 
-        # Left Join
-        result = benchmark(lambda: left_df.join(right_df, on='id', how='left'), iterations=5)
-        print(f"  Left Join:             {result['mean']:8.3f} ms  (std: {result['std']:.3f})")
+        # Left Join (hash)
+        result = benchmark_stats(partial(left_df.join, right_df, on='id', how='left'))
+        print(f"  Left Join (hash):      {result['mean_ms']:8.3f} ms  (std: {result['std_ms']:.3f})")
+
+        # Pre-sort both sides once (untimed) and flag the key as sorted so
+        # Polars can take its sorted-merge join path
+        left_sorted = left_df.sort('id').with_columns(pl.col('id').set_sorted())
+        right_sorted = right_df.sort('id').with_columns(pl.col('id').set_sorted())
+
+        # Inner Join (sort-merge)
+        result = benchmark_stats(partial(left_sorted.join, right_sorted, on='id', how='inner'))
+        print(f"  Inner Join (sort-merge): {result['mean_ms']:6.3f} ms  (std: {result['std_ms']:.3f})")
+
+        # Left Join (sort-merge)
+        result = benchmark_stats(partial(left_sorted.join, right_sorted, on='id', how='left'))
+        print(f"  Left Join (sort-merge):  {result['mean_ms']:6.3f} ms  (std: {result['std_ms']:.3f})")
 
     print("\n" + "=" * 70)
     print("NOTES:")
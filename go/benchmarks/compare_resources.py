@@ -6,11 +6,19 @@ Measures memory usage, allocations, and throughput.
 Run with: python3 compare_resources.py
 """
 
-import time
+import argparse
+import ctypes
+import ctypes.util
+import os
 import tracemalloc
 import gc
-import numpy as np
 import sys
+import timeit
+from functools import lru_cache, partial
+import numpy as np
+
+import harness
+from harness import SEED, format_time, measure_memory_and_time, retained_bytes
 
 try:
     import polars as pl
@@ -26,42 +34,23 @@ except ImportError:
     HAS_PANDAS = False
     print("Warning: Pandas not installed")
 
-SEED = 42
-
-def measure_memory_and_time(func, iterations=3):
-    """Measure peak memory usage and execution time."""
-    gc.collect()
-
-    # Warmup
-    func()
-    gc.collect()
-
-    # Measure time
-    times = []
-    for _ in range(iterations):
-        start = time.perf_counter()
-        func()
-        elapsed = time.perf_counter() - start
-        times.append(elapsed)
-
-    avg_time = np.mean(times) * 1000  # ms
-
-    # Measure memory
-    gc.collect()
-    tracemalloc.start()
-    func()
-    current, peak = tracemalloc.get_traced_memory()
-    tracemalloc.stop()
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    print("Warning: Numba not installed (pip install numba); no throughput ceiling")
 
-    return avg_time, peak / 1024 / 1024  # time in ms, memory in MB
+try:
+    import psutil
+    HAS_PSUTIL = True
+except ImportError:
+    HAS_PSUTIL = False
+    print("Warning: psutil not installed (pip install psutil); "
+          "memory efficiency falls back to tracemalloc")
 
 def format_result(time_ms, memory_mb):
-    if time_ms < 1:
-        time_str = f"{time_ms*1000:.1f} µs"
-    elif time_ms < 1000:
-        time_str = f"{time_ms:.2f} ms"
-    else:
-        time_str = f"{time_ms/1000:.2f} s"
+    time_str = format_time(time_ms)
 
     if memory_mb < 1:
         mem_str = f"{memory_mb*1024:.1f} KB"
@@ -70,15 +59,16 @@ def format_result(time_ms, memory_mb):
 
     return time_str, mem_str
 
-def print_header(title):
-    print()
-    print("=" * 80)
-    print(title)
-    print("=" * 80)
-    print(f"{'Operation':<30} {'Polars Time':>12} {'Polars Mem':>12} {'Pandas Time':>12} {'Pandas Mem':>12}")
-    print("-" * 80)
+def table_header(title):
+    """A time/memory table's banner, column names and rule, as lines."""
+    # By default the memory figure is the result's retained size, not the
+    # memory an operation used (intermediates such as hash tables aren't
+    # counted), so only --detailed's tracemalloc peak is labelled "Mem"
+    mem = 'Mem' if harness.DETAILED_MEMORY else 'Size'
+    columns = f"{'Operation':<30} {'Polars Time':>12} {'Polars ' + mem:>12} {'Pandas Time':>12} {'Pandas ' + mem:>12}"
+    return harness.header_lines(title, width=80) + [columns, "-" * 80]
 
-def print_row(operation, polars_result, pandas_result):
+def format_row(operation, polars_result, pandas_result):
     if polars_result:
         p_time, p_mem = format_result(*polars_result)
     else:
@@ -89,126 +79,231 @@ def print_row(operation, polars_result, pandas_result):
     else:
         pd_time, pd_mem = "N/A", "N/A"
 
-    print(f"{operation:<30} {p_time:>12} {p_mem:>12} {pd_time:>12} {pd_mem:>12}")
+    return f"{operation:<30} {p_time:>12} {p_mem:>12} {pd_time:>12} {pd_mem:>12}"
+
+def write_rows(rows):
+    """Write a whole section (header and rows) in one call, so it can't
+    interleave with other output and the stream lock is taken once."""
+    sys.stdout.write("\n".join(rows) + "\n")
+
+# ============================================================================
+# Test Data
+# ============================================================================
+
+# Cached per size, so the RNG work and allocations happen once rather than
+# in every section (and outside the measured memory)
+
+@lru_cache(maxsize=None)
+def _gen_f64(n, scale=100.0, seed=SEED):
+    """Read-only float64 normal data, scaled by `scale`."""
+    rng = np.random.default_rng(seed)
+    data = rng.standard_normal(n, dtype=np.float64)
+    data *= scale  # in place, no temporary
+    data.setflags(write=False)
+    return data
+
+@lru_cache(maxsize=None)
+def _gen_f64_rows(n, rows, scale=100.0, seed=SEED):
+    """`rows` read-only float64 columns of length n from one RNG call.
+
+    Each row of the C-ordered (rows, n) block is itself contiguous.
+    """
+    rng = np.random.default_rng(seed)
+    mat = rng.standard_normal((rows, n), dtype=np.float64)
+    mat *= scale
+    mat.setflags(write=False)
+    return mat
+
+@lru_cache(maxsize=None)
+def _cat_codes(n, k=5, seed=SEED):
+    """Read-only int8 category codes in [0, k).
+
+    Drawing small ints is far cheaper than rng.choice over strings; the
+    categoricals are built from these codes and the string form is only
+    materialized where a string baseline is measured.
+    """
+    rng = np.random.default_rng(seed)
+    codes = rng.integers(0, k, size=n, dtype=np.int8)
+    codes.setflags(write=False)
+    return codes
+
+def _cat_strings(labels, codes):
+    """The string column the codes stand for (fixed-width, like rng.choice)."""
+    return np.asarray(labels)[codes]
+
+def _pl_categorical(labels, codes):
+    return pl.Series(labels, dtype=pl.Categorical).gather(codes)
+
+def _pd_categorical(labels, codes):
+    return pd.Categorical.from_codes(codes, categories=labels)
+
+# The Series wrap the cached array without copying where the library allows
+# (float64 with no nulls), so the 8 MB input isn't duplicated per library
+
+@lru_cache(maxsize=None)
+def _gen_floats(n, dtype=np.float64):
+    """_gen_f64(n), converted once to `dtype` (e.g. np.float32)."""
+    data = _gen_f64(n)
+    if data.dtype != dtype:
+        data = data.astype(dtype)
+        data.setflags(write=False)
+    return data
+
+@lru_cache(maxsize=None)
+def _gen_pl_series(n, dtype=np.float64):
+    return pl.Series('x', _gen_floats(n, dtype), nan_to_null=False)
+
+@lru_cache(maxsize=None)
+def _gen_pd_series(n, dtype=np.float64):
+    return pd.Series(_gen_floats(n, dtype), copy=False)
 
 # ============================================================================
 # Resource Benchmarks
 # ============================================================================
 
 def benchmark_aggregation_resources(n):
-    print_header(f"AGGREGATION RESOURCES - {n:,} elements")
-
-    np.random.seed(SEED)
-    data = np.random.randn(n) * 100
+    rows = table_header(f"AGGREGATION RESOURCES - {n:,} elements")
 
     if HAS_POLARS:
-        pl_series = pl.Series(data)
+        pl_series = _gen_pl_series(n)
     if HAS_PANDAS:
-        pd_series = pd.Series(data)
+        pd_series = _gen_pd_series(n)
 
     # Sum
     polars_result = measure_memory_and_time(lambda: pl_series.sum()) if HAS_POLARS else None
     pandas_result = measure_memory_and_time(lambda: pd_series.sum()) if HAS_PANDAS else None
-    print_row("Sum", polars_result, pandas_result)
+    rows.append(format_row("Sum", polars_result, pandas_result))
 
     # Variance
     polars_result = measure_memory_and_time(lambda: pl_series.var()) if HAS_POLARS else None
     pandas_result = measure_memory_and_time(lambda: pd_series.var()) if HAS_PANDAS else None
-    print_row("Variance", polars_result, pandas_result)
+    rows.append(format_row("Variance", polars_result, pandas_result))
 
     # Median
     polars_result = measure_memory_and_time(lambda: pl_series.median()) if HAS_POLARS else None
     pandas_result = measure_memory_and_time(lambda: pd_series.median()) if HAS_PANDAS else None
-    print_row("Median", polars_result, pandas_result)
+    rows.append(format_row("Median", polars_result, pandas_result))
 
     # Quantile
     polars_result = measure_memory_and_time(lambda: pl_series.quantile(0.95)) if HAS_POLARS else None
     pandas_result = measure_memory_and_time(lambda: pd_series.quantile(0.95)) if HAS_PANDAS else None
-    print_row("Quantile (0.95)", polars_result, pandas_result)
+    rows.append(format_row("Quantile (0.95)", polars_result, pandas_result))
+
+    # Fused: all four aggregations in one Polars select, which can share a
+    # pass over the data. Pandas has no equivalent, so it reports N/A.
+    if HAS_POLARS:
+        pl_df = pl_series.to_frame()
+        fused_aggs = [
+            pl.col('x').sum().alias('s'),
+            pl.col('x').var().alias('v'),
+            pl.col('x').median().alias('m'),
+            pl.col('x').quantile(0.95).alias('q'),
+        ]
+        polars_result = measure_memory_and_time(lambda: pl_df.select(fused_aggs))
+    else:
+        polars_result = None
+    rows.append(format_row("Fused Agg (sum/var/med/q95)", polars_result, None))
+
+    write_rows(rows)
 
 def benchmark_window_resources(n):
-    print_header(f"WINDOW FUNCTION RESOURCES - {n:,} elements, window=100")
+    rows = table_header(f"WINDOW FUNCTION RESOURCES - {n:,} elements, window=100")
 
-    np.random.seed(SEED)
-    data = np.random.randn(n) * 100
     window = 100
 
     if HAS_POLARS:
-        pl_series = pl.Series(data)
+        pl_series = _gen_pl_series(n)
     if HAS_PANDAS:
-        pd_series = pd.Series(data)
+        pd_series = _gen_pd_series(n)
 
     # Rolling Sum
     polars_result = measure_memory_and_time(lambda: pl_series.rolling_sum(window)) if HAS_POLARS else None
     pandas_result = measure_memory_and_time(lambda: pd_series.rolling(window).sum()) if HAS_PANDAS else None
-    print_row("Rolling Sum", polars_result, pandas_result)
+    rows.append(format_row("Rolling Sum", polars_result, pandas_result))
+
+    # Rolling Sum as a difference of prefix sums: two linear passes whatever
+    # the window, so it shows how far the generic rolling path is from
+    # bandwidth-bound. Floating-point error grows along the prefix sum, and
+    # the first window-1 values are partial sums rather than nulls.
+    def pl_cumsum_rolling():
+        cs = pl_series.cum_sum()
+        return cs - cs.shift(window).fill_null(0)
+
+    def pd_cumsum_rolling():
+        cs = pd_series.cumsum()
+        return cs - cs.shift(window, fill_value=0)
+
+    polars_result = measure_memory_and_time(pl_cumsum_rolling) if HAS_POLARS else None
+    pandas_result = measure_memory_and_time(pd_cumsum_rolling) if HAS_PANDAS else None
+    rows.append(format_row("Rolling Sum (cumsum trick)", polars_result, pandas_result))
 
     # Rolling Mean
     polars_result = measure_memory_and_time(lambda: pl_series.rolling_mean(window)) if HAS_POLARS else None
     pandas_result = measure_memory_and_time(lambda: pd_series.rolling(window).mean()) if HAS_PANDAS else None
-    print_row("Rolling Mean", polars_result, pandas_result)
+    rows.append(format_row("Rolling Mean", polars_result, pandas_result))
 
     # Rolling Min
     polars_result = measure_memory_and_time(lambda: pl_series.rolling_min(window)) if HAS_POLARS else None
     pandas_result = measure_memory_and_time(lambda: pd_series.rolling(window).min()) if HAS_PANDAS else None
-    print_row("Rolling Min", polars_result, pandas_result)
+    rows.append(format_row("Rolling Min", polars_result, pandas_result))
 
     # Cumulative Sum
     polars_result = measure_memory_and_time(lambda: pl_series.cum_sum()) if HAS_POLARS else None
     pandas_result = measure_memory_and_time(lambda: pd_series.cumsum()) if HAS_PANDAS else None
-    print_row("Cumulative Sum", polars_result, pandas_result)
+    rows.append(format_row("Cumulative Sum", polars_result, pandas_result))
 
     # Diff
     polars_result = measure_memory_and_time(lambda: pl_series.diff()) if HAS_POLARS else None
     pandas_result = measure_memory_and_time(lambda: pd_series.diff()) if HAS_PANDAS else None
-    print_row("Diff", polars_result, pandas_result)
+    rows.append(format_row("Diff", polars_result, pandas_result))
+
+    write_rows(rows)
 
 def benchmark_horizontal_resources(n):
-    print_header(f"HORIZONTAL/FOLD RESOURCES - {n:,} rows x 3 columns")
+    rows = table_header(f"HORIZONTAL/FOLD RESOURCES - {n:,} rows x 3 columns")
 
-    np.random.seed(SEED)
-    col_a = np.random.randn(n) * 100
-    col_b = np.random.randn(n) * 100
-    col_c = np.random.randn(n) * 100
+    col_a, col_b, col_c = _gen_f64_rows(n, 3)
 
     if HAS_POLARS:
         pl_df = pl.DataFrame({'a': col_a, 'b': col_b, 'c': col_c})
     if HAS_PANDAS:
-        pd_df = pd.DataFrame({'a': col_a, 'b': col_b, 'c': col_c})
+        pd_df = pd.DataFrame({'a': col_a, 'b': col_b, 'c': col_c}, copy=False)
 
     # Sum Horizontal
     polars_result = measure_memory_and_time(lambda: pl_df.select(pl.sum_horizontal('a', 'b', 'c'))) if HAS_POLARS else None
     pandas_result = measure_memory_and_time(lambda: pd_df[['a', 'b', 'c']].sum(axis=1)) if HAS_PANDAS else None
-    print_row("Sum Horizontal (3 cols)", polars_result, pandas_result)
+    rows.append(format_row("Sum Horizontal (3 cols)", polars_result, pandas_result))
 
     # Min Horizontal
     polars_result = measure_memory_and_time(lambda: pl_df.select(pl.min_horizontal('a', 'b', 'c'))) if HAS_POLARS else None
     pandas_result = measure_memory_and_time(lambda: pd_df[['a', 'b', 'c']].min(axis=1)) if HAS_PANDAS else None
-    print_row("Min Horizontal (3 cols)", polars_result, pandas_result)
+    rows.append(format_row("Min Horizontal (3 cols)", polars_result, pandas_result))
+
+    write_rows(rows)
 
 def benchmark_categorical_resources(n):
-    print_header(f"CATEGORICAL RESOURCES - {n:,} rows")
+    rows = table_header(f"CATEGORICAL RESOURCES - {n:,} rows")
 
-    np.random.seed(SEED)
-    categories = np.random.choice(['cat_a', 'cat_b', 'cat_c', 'cat_d', 'cat_e'], n)
-    values = np.random.randn(n) * 100
+    labels = ['cat_a', 'cat_b', 'cat_c', 'cat_d', 'cat_e']
+    codes = _cat_codes(n, len(labels))
+    values = _gen_f64(n)
 
     # Creation
     def create_polars():
         return pl.DataFrame({
-            'category': pl.Series(categories).cast(pl.Categorical),
+            'category': _pl_categorical(labels, codes),
             'value': values
         })
 
     def create_pandas():
         return pd.DataFrame({
-            'category': pd.Categorical(categories),
+            'category': _pd_categorical(labels, codes),
             'value': values
         })
 
     polars_result = measure_memory_and_time(create_polars) if HAS_POLARS else None
     pandas_result = measure_memory_and_time(create_pandas) if HAS_PANDAS else None
-    print_row("Create Categorical DF", polars_result, pandas_result)
+    rows.append(format_row("Create Categorical DF", polars_result, pandas_result))
 
     # GroupBy
     if HAS_POLARS:
@@ -222,112 +317,239 @@ def benchmark_categorical_resources(n):
     pandas_result = measure_memory_and_time(
         lambda: pd_df.groupby('category', observed=True)['value'].sum()
     ) if HAS_PANDAS else None
-    print_row("GroupBy (categorical)", polars_result, pandas_result)
+    rows.append(format_row("GroupBy (categorical)", polars_result, pandas_result))
+
+    write_rows(rows)
+
+def traced_peak_bytes(func):
+    """Run func(); return (result, peak Python-tracked allocation in bytes).
+
+    Cyclic GC is paused so a collection mid-allocation can't lower the peak.
+    """
+    gc.collect()
+    gc.disable()
+    tracemalloc.start(1)
+    try:
+        result = func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        gc.enable()
+    return result, peak
+
+# glibc keeps freed chunks on its free lists; trimming them before a
+# baseline read stops earlier frees from hiding the next allocation
+_LIBC = None
+if sys.platform.startswith('linux'):
+    try:
+        _LIBC = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6')
+        _LIBC.malloc_trim
+    except (OSError, AttributeError):
+        _LIBC = None
+
+def _malloc_trim():
+    if _LIBC is not None:
+        _LIBC.malloc_trim(0)
+
+def rss_delta_bytes(func):
+    """Run func(); return (result, resident-set growth in bytes).
+
+    Sees allocations outside the CPython allocator (Polars' Rust and Arrow
+    buffers), but only page-granular growth the allocator couldn't serve
+    from memory it already held, so it can read 0. Cyclic GC is paused so
+    nothing is freed between the two readings.
+    """
+    proc = psutil.Process(os.getpid())
+    gc.collect()
+    _malloc_trim()
+    gc.disable()
+    try:
+        rss_before = proc.memory_info().rss
+        result = func()
+        rss_after = proc.memory_info().rss
+    finally:
+        gc.enable()
+    return result, max(0, rss_after - rss_before)
+
+def measure_build(func):
+    """Build func()'s result; return (retained bytes, process-level bytes).
+
+    The retained size is the primary figure. The second is RSS growth
+    (tracemalloc's peak with --detailed, or None without psutil), shown
+    alongside it.
+    """
+    if harness.DETAILED_MEMORY:
+        result, process_bytes = traced_peak_bytes(func)
+    elif HAS_PSUTIL:
+        result, process_bytes = rss_delta_bytes(func)
+    else:
+        result, process_bytes = func(), None
+    return retained_bytes(result), process_bytes
+
+def print_memory_comparison(library, categorical, string):
+    """Print categorical vs string (retained, process-level) sizes."""
+    process_label = 'tracemalloc peak' if harness.DETAILED_MEMORY else 'RSS growth'
+    for kind, (retained, process_bytes) in (('Categorical', categorical), ('String', string)):
+        extra = (f"  ({process_label} {process_bytes/1024/1024:.1f} MB)"
+                 if process_bytes is not None else "")
+        label = f"{library} {kind}:"
+        print(f"{label:<22} {retained/1024/1024:.1f} MB{extra}")
+    if string[0] > 0:
+        print(f"Memory savings:        {(1 - categorical[0]/string[0])*100:.1f}%")
+    else:
+        print("Memory savings:        N/A")
 
 def benchmark_memory_efficiency():
-    print_header("MEMORY EFFICIENCY - Categorical vs String (1M rows)")
+    # Not a time/memory table, so just the section banner
+    harness.print_header("MEMORY EFFICIENCY - Categorical vs String (1M rows)", width=80)
 
-    np.random.seed(SEED)
     n = 1_000_000
-    categories = np.random.choice(['category_a', 'category_b', 'category_c', 'category_d', 'category_e'], n)
+    labels = ['category_a', 'category_b', 'category_c', 'category_d', 'category_e']
+    codes = _cat_codes(n, len(labels))
+    # String baseline, materialized outside the measured allocations
+    strings = _cat_strings(labels, codes)
 
     # Polars Categorical
     if HAS_POLARS:
-        gc.collect()
-        tracemalloc.start()
-        pl_cat = pl.Series(categories).cast(pl.Categorical)
-        _, peak_cat = tracemalloc.get_traced_memory()
-        tracemalloc.stop()
-
-        gc.collect()
-        tracemalloc.start()
-        pl_str = pl.Series(categories)
-        _, peak_str = tracemalloc.get_traced_memory()
-        tracemalloc.stop()
-
-        print(f"Polars Categorical:    {peak_cat/1024/1024:.1f} MB")
-        print(f"Polars String:         {peak_str/1024/1024:.1f} MB")
-        print(f"Memory savings:        {(1 - peak_cat/peak_str)*100:.1f}%")
+        print_memory_comparison(
+            "Polars",
+            measure_build(lambda: _pl_categorical(labels, codes)),
+            measure_build(lambda: pl.Series(strings)),
+        )
 
     print()
 
     # Pandas Categorical
     if HAS_PANDAS:
-        gc.collect()
-        tracemalloc.start()
-        pd_cat = pd.Categorical(categories)
-        _, peak_cat = tracemalloc.get_traced_memory()
-        tracemalloc.stop()
-
-        gc.collect()
-        tracemalloc.start()
-        pd_str = pd.Series(categories)
-        _, peak_str = tracemalloc.get_traced_memory()
-        tracemalloc.stop()
-
-        print(f"Pandas Categorical:    {peak_cat/1024/1024:.1f} MB")
-        print(f"Pandas String:         {peak_str/1024/1024:.1f} MB")
-        print(f"Memory savings:        {(1 - peak_cat/peak_str)*100:.1f}%")
+        print_memory_comparison(
+            "Pandas",
+            measure_build(lambda: _pd_categorical(labels, codes)),
+            measure_build(lambda: pd.Series(strings)),
+        )
+
+def best_call_seconds(func, repeat=5):
+    """Best per-call time (s) of func over `repeat` timeit blocks.
+
+    autorange() picks the block size (enough calls for >= 0.2s), so timer
+    overhead is negligible. The best block is the least-disturbed run, which
+    for bandwidth-bound reductions is the closest to peak throughput.
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number
+
+if HAS_NUMBA:
+    # Parallel hand-written reductions: a memory-bandwidth reference the
+    # Polars/Pandas figures can be read against
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _nb_sum(a):
+        s = 0.0
+        for i in prange(a.shape[0]):
+            s += a[i]
+        return s
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _nb_mean(a):
+        s = 0.0
+        for i in prange(a.shape[0]):
+            s += a[i]
+        return s / a.shape[0]
+
+    # min/max as a scalar prange reduction (m = min(m, a[i])) doesn't
+    # vectorize; reducing contiguous chunks with ndarray.min/max does, and
+    # only the per-chunk partials are combined serially
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _nb_min(a):
+        chunk = 65536
+        n_chunks = (a.shape[0] + chunk - 1) // chunk
+        partial_min = np.empty(n_chunks, dtype=a.dtype)
+        for c in prange(n_chunks):
+            partial_min[c] = a[c * chunk:(c + 1) * chunk].min()
+        return partial_min.min()
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _nb_max(a):
+        chunk = 65536
+        n_chunks = (a.shape[0] + chunk - 1) // chunk
+        partial_max = np.empty(n_chunks, dtype=a.dtype)
+        for c in prange(n_chunks):
+            partial_max[c] = a[c * chunk:(c + 1) * chunk].max()
+        return partial_max.max()
+
+    NUMBA_REDUCTIONS = {'sum': _nb_sum, 'mean': _nb_mean, 'min': _nb_min, 'max': _nb_max}
 
 def benchmark_throughput():
-    print_header("THROUGHPUT (GB/s) - 1M float64 elements")
+    # GB/s table with its own columns, so just the section banner
+    harness.print_header("PEAK THROUGHPUT (GB/s) - 1M float64 and float32 elements", width=80)
 
-    np.random.seed(SEED)
     n = 1_000_000
-    data_size_gb = n * 8 / 1e9  # 8 bytes per float64
-    data = np.random.randn(n) * 100
-
-    if HAS_POLARS:
-        pl_series = pl.Series(data)
-    if HAS_PANDAS:
-        pd_series = pd.Series(data)
 
+    # (label, method name) - timed as bound methods, no lambda per call
     operations = [
-        ("Sum", lambda: pl_series.sum(), lambda: pd_series.sum()),
-        ("Mean", lambda: pl_series.mean(), lambda: pd_series.mean()),
-        ("Min", lambda: pl_series.min(), lambda: pd_series.min()),
-        ("Max", lambda: pl_series.max(), lambda: pd_series.max()),
+        ("Sum", 'sum'),
+        ("Mean", 'mean'),
+        ("Min", 'min'),
+        ("Max", 'max'),
     ]
 
-    print(f"{'Operation':<30} {'Polars GB/s':>15} {'Pandas GB/s':>15}")
-    print("-" * 60)
+    print(f"{'Operation (dtype)':<30} {'Polars GB/s':>15} {'Pandas GB/s':>15} {'Numba GB/s':>15}")
+    print("-" * 80)
+
+    # float32 packs twice the lanes per SIMD register and halves the bytes
+    # moved; similar GB/s across the two widths means a kernel exploits it
+    for dtype, suffix in ((np.float64, 'f64'), (np.float32, 'f32')):
+        data = _gen_floats(n, dtype)
+        data_size_gb = data.nbytes / 1e9
 
-    for name, polars_fn, pandas_fn in operations:
-        # Polars throughput
         if HAS_POLARS:
-            times = []
-            for _ in range(10):
-                start = time.perf_counter()
-                polars_fn()
-                times.append(time.perf_counter() - start)
-            polars_gbps = data_size_gb / np.mean(times)
-        else:
-            polars_gbps = 0
-
-        # Pandas throughput
+            pl_series = _gen_pl_series(n, dtype)
         if HAS_PANDAS:
-            times = []
-            for _ in range(10):
-                start = time.perf_counter()
-                pandas_fn()
-                times.append(time.perf_counter() - start)
-            pandas_gbps = data_size_gb / np.mean(times)
-        else:
-            pandas_gbps = 0
-
-        print(f"{name:<30} {polars_gbps:>14.1f}  {pandas_gbps:>14.1f}")
+            pd_series = _gen_pd_series(n, dtype)
+        if HAS_NUMBA:
+            # Compile (or load from the on-disk cache) outside the timed runs
+            for kernel in NUMBA_REDUCTIONS.values():
+                kernel(data)
+
+        for name, method in operations:
+            if HAS_POLARS:
+                polars_gbps = data_size_gb / best_call_seconds(getattr(pl_series, method))
+            else:
+                polars_gbps = 0
+
+            if HAS_PANDAS:
+                pandas_gbps = data_size_gb / best_call_seconds(getattr(pd_series, method))
+            else:
+                pandas_gbps = 0
+
+            if HAS_NUMBA:
+                numba_gbps = data_size_gb / best_call_seconds(partial(NUMBA_REDUCTIONS[method], data))
+            else:
+                numba_gbps = 0
+
+            label = f"{name} ({suffix})"
+            print(f"{label:<30} {polars_gbps:>14.1f}  {pandas_gbps:>14.1f}  {numba_gbps:>14.1f}")
 
 # ============================================================================
 # Main
 # ============================================================================
 
 def main():
+    parser = argparse.ArgumentParser(description='Polars vs Pandas resource benchmark')
+    parser.add_argument('--detailed', '--trace', action='store_true',
+                        help='Measure memory with tracemalloc (Python allocations) instead of result sizes')
+    args = parser.parse_args()
+
+    harness.DETAILED_MEMORY = args.detailed
+
     print()
     print("=" * 80)
     print("RESOURCE CONSUMPTION BENCHMARK: Polars vs Pandas")
     print("=" * 80)
     print()
     print(f"Using seed {SEED} for reproducible data")
+    print(f"Memory: {'tracemalloc peak' if harness.DETAILED_MEMORY else 'retained result size'} (cold first call)")
     print()
 
     n = 1_000_000
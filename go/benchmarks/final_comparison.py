@@ -4,17 +4,47 @@ Final comparison benchmark: Galleon vs Polars vs Pandas
 Tests with identical data across multiple sizes
 """
 
+import argparse
+import math
+import multiprocessing as mp
+from multiprocessing import shared_memory
+from functools import partial
+from statistics import fmean, quantiles
 import time
+import traceback
+from queue import Empty
 import numpy as np
+
+from harness import pin_to_numa_node
+
+# Pin to NUMA node 0 before polars starts its thread pool, so its threads
+# stay on one node and size to it
+NUMA_CPUS = pin_to_numa_node(0)
+
 import polars as pl
 import pandas as pd
 import sys
 
-def run_benchmark(name, func, warmup=2, iterations=5):
-    """Run benchmark with warmup and return median time in ms"""
-    # Warmup
-    for _ in range(warmup):
+# Keys of the (operation, input shape) pairs already warmed up
+_warmed = set()
+
+def _warm_once(key, func):
+    """Call func once, the first time key is seen"""
+    if key not in _warmed:
+        _warmed.add(key)
         func()
+
+def warm_polars_pool():
+    """Start Polars' thread pool with a trivial query, once per process"""
+    _warm_once('polars thread pool',
+               lambda: pl.DataFrame({'x': [1]}).group_by('x').agg(pl.col('x').sum().alias('s')))
+
+def run_benchmark(name, func, shape=None, iterations=5):
+    """Run benchmark and return median time in ms
+    
+    func is warmed up with a single call per (name, shape), not per run.
+    """
+    _warm_once((name, shape), func)
     
     # Timed runs
     times = []
@@ -60,6 +90,8 @@ def generate_data(n, seed=42):
 
 def benchmark_polars(data):
     """Benchmark Polars operations"""
+    warm_polars_pool()
+    
     # Create DataFrames
     left_df = pl.DataFrame({
         'id': data['left_ids'],
@@ -75,37 +107,51 @@ def benchmark_polars(data):
     })
     
     results = {}
+    bench = partial(run_benchmark, shape=data['left_n'])
     
     # Inner Join
-    median, min_t, max_t = run_benchmark("Inner Join", 
+    median, min_t, max_t = bench("Inner Join", 
         lambda: left_df.join(right_df, on='id', how='inner'))
     results['inner_join'] = (median, min_t, max_t)
     
     # Left Join
-    median, min_t, max_t = run_benchmark("Left Join",
+    median, min_t, max_t = bench("Left Join",
         lambda: left_df.join(right_df, on='id', how='left'))
     results['left_join'] = (median, min_t, max_t)
     
     # GroupBy Sum
-    median, min_t, max_t = run_benchmark("GroupBy Sum",
+    median, min_t, max_t = bench("GroupBy Sum",
         lambda: groupby_df.group_by('key').agg(pl.col('value').sum()))
     results['groupby_sum'] = (median, min_t, max_t)
     
     # GroupBy Mean
-    median, min_t, max_t = run_benchmark("GroupBy Mean",
+    median, min_t, max_t = bench("GroupBy Mean",
         lambda: groupby_df.group_by('key').agg(pl.col('value').mean()))
     results['groupby_mean'] = (median, min_t, max_t)
     
-    # GroupBy Multi-Agg
-    median, min_t, max_t = run_benchmark("GroupBy Multi",
-        lambda: groupby_df.group_by('key').agg([
-            pl.col('value').sum().alias('sum'),
-            pl.col('value').mean().alias('mean'),
-            pl.col('value').min().alias('min'),
-            pl.col('value').max().alias('max'),
-            pl.col('value').count().alias('count'),
-        ]))
+    # GroupBy Multi-Agg (one lazy query: all five aggregations in one pass)
+    groupby_lf = groupby_df.lazy()
+    multi_query = groupby_lf.group_by('key').agg([
+        pl.col('value').sum().alias('sum'),
+        pl.col('value').mean().alias('mean'),
+        pl.col('value').min().alias('min'),
+        pl.col('value').max().alias('max'),
+        pl.col('value').count().alias('count'),
+    ])
+    median, min_t, max_t = bench("GroupBy Multi", multi_query.collect)
     results['groupby_multi'] = (median, min_t, max_t)
+
+    # GroupBy Fused: the four single-agg queries above, but planned and run
+    # together by collect_all so the engine can share work between them
+    single_queries = [
+        groupby_lf.group_by('key').agg(pl.col('value').sum()),
+        groupby_lf.group_by('key').agg(pl.col('value').mean()),
+        groupby_lf.group_by('key').agg(pl.col('value').min()),
+        groupby_lf.group_by('key').agg(pl.col('value').max()),
+    ]
+    median, min_t, max_t = bench("GroupBy Fused",
+        lambda: pl.collect_all(single_queries))
+    results['groupby_fused'] = (median, min_t, max_t)
     
     return results
 
@@ -126,31 +172,38 @@ def benchmark_pandas(data):
     })
     
     results = {}
+    bench = partial(run_benchmark, shape=data['left_n'])
     
     # Inner Join
-    median, min_t, max_t = run_benchmark("Inner Join",
+    median, min_t, max_t = bench("Inner Join",
         lambda: pd.merge(left_df, right_df, on='id', how='inner'))
     results['inner_join'] = (median, min_t, max_t)
     
     # Left Join
-    median, min_t, max_t = run_benchmark("Left Join",
+    median, min_t, max_t = bench("Left Join",
         lambda: pd.merge(left_df, right_df, on='id', how='left'))
     results['left_join'] = (median, min_t, max_t)
     
     # GroupBy Sum
-    median, min_t, max_t = run_benchmark("GroupBy Sum",
+    median, min_t, max_t = bench("GroupBy Sum",
         lambda: groupby_df.groupby('key')['value'].sum())
     results['groupby_sum'] = (median, min_t, max_t)
     
     # GroupBy Mean
-    median, min_t, max_t = run_benchmark("GroupBy Mean",
+    median, min_t, max_t = bench("GroupBy Mean",
         lambda: groupby_df.groupby('key')['value'].mean())
     results['groupby_mean'] = (median, min_t, max_t)
     
     # GroupBy Multi-Agg
-    median, min_t, max_t = run_benchmark("GroupBy Multi",
+    median, min_t, max_t = bench("GroupBy Multi",
         lambda: groupby_df.groupby('key')['value'].agg(['sum', 'mean', 'min', 'max', 'count']))
     results['groupby_multi'] = (median, min_t, max_t)
+
+    # GroupBy Fused counterpart: the same four aggregations as separate queries
+    median, min_t, max_t = bench("GroupBy Fused",
+        lambda: [groupby_df.groupby('key')['value'].agg(func)
+                 for func in ('sum', 'mean', 'min', 'max')])
+    results['groupby_fused'] = (median, min_t, max_t)
     
     return results
 
@@ -162,7 +215,7 @@ def print_results(size, polars_results, pandas_results):
     print(f"{'Operation':<20} {'Polars':>12} {'Pandas':>12} {'Polars speedup':>15}")
     print(f"{'-'*70}")
     
-    for op in ['inner_join', 'left_join', 'groupby_sum', 'groupby_mean', 'groupby_multi']:
+    for op in ['inner_join', 'left_join', 'groupby_sum', 'groupby_mean', 'groupby_multi', 'groupby_fused']:
         polars_time = polars_results[op][0]
         pandas_time = pandas_results[op][0]
         speedup = pandas_time / polars_time if polars_time > 0 else 0
@@ -170,14 +223,179 @@ def print_results(size, polars_results, pandas_results):
         op_name = op.replace('_', ' ').title()
         print(f"{op_name:<20} {polars_time:>10.2f}ms {pandas_time:>10.2f}ms {speedup:>13.1f}x")
 
+def print_speedup_summary(all_results):
+    """Print the geometric mean and quartiles of pandas/polars time ratios
+    
+    Ratios are combined across every (operation, size) pair. The geometric
+    mean keeps one very slow operation from dominating, as it would in an
+    arithmetic average of per-row speedups.
+    """
+    ratios = []
+    for size_results in all_results.values():
+        pandas_results = size_results['pandas']
+        for op, (polars_time, _, _) in size_results['polars'].items():
+            pandas_time = pandas_results[op][0]
+            if polars_time > 0 and pandas_time > 0:
+                ratios.append(pandas_time / polars_time)
+    if not ratios:
+        return
+    
+    geomean = math.exp(fmean(math.log(r) for r in ratios))
+    
+    print(f"\n{'='*70}")
+    print(f"SPEEDUP SUMMARY - pandas/polars time over {len(ratios)} (operation, size) pairs")
+    print(f"{'='*70}")
+    print(f"  Geomean pandas/polars: {geomean:.2f}x")
+    if len(ratios) >= 2:
+        q1, q2, q3 = quantiles(ratios, n=4)
+        print(f"  Quartiles:             25%: {q1:.2f}x  50%: {q2:.2f}x  75%: {q3:.2f}x")
+
+# ============================================================================
+# Per-library worker processes
+# ============================================================================
+
+BENCHMARKS = {
+    'polars': benchmark_polars,
+    'pandas': benchmark_pandas,
+}
+
+def share_data(data):
+    """Copy data's arrays into shared memory blocks.
+
+    Returns (spec, blocks): spec is the picklable description workers use to
+    attach (arrays as (block name, shape, dtype), other values as-is), and
+    blocks must be closed and unlinked by the caller when done.
+    """
+    spec = {}
+    blocks = []
+    for key, value in data.items():
+        if isinstance(value, np.ndarray):
+            block = shared_memory.SharedMemory(create=True, size=max(1, value.nbytes))
+            np.ndarray(value.shape, dtype=value.dtype, buffer=block.buf)[...] = value
+            blocks.append(block)
+            spec[key] = ('shm', block.name, value.shape, value.dtype.str)
+        else:
+            spec[key] = ('value', value)
+    return spec, blocks
+
+def attach_data(spec):
+    """Rebuild the data dict from share_data()'s spec as shared-memory views."""
+    data = {}
+    blocks = []
+    for key, entry in spec.items():
+        if entry[0] == 'shm':
+            _, name, shape, dtype = entry
+            try:
+                # The parent owns (and unlinks) the block; Python 3.13+ can
+                # skip registering it with this process's resource tracker
+                block = shared_memory.SharedMemory(name=name, track=False)
+            except TypeError:
+                block = shared_memory.SharedMemory(name=name)
+            blocks.append(block)
+            data[key] = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+        else:
+            data[key] = entry[1]
+    return data, blocks
+
+def run_worker(library, spec, queue):
+    """Process entry point: run one library's benchmarks on the shared data.
+
+    Puts ('ok', results) on the queue, or ('error', traceback) if anything
+    fails, so the parent never waits on a result that won't come.
+    """
+    data, blocks = None, []
+    try:
+        data, blocks = attach_data(spec)
+        queue.put(('ok', BENCHMARKS[library](data)))
+    except BaseException:
+        queue.put(('error', traceback.format_exc()))
+        raise
+    finally:
+        # Views must be gone before the mappings can be closed
+        del data
+        for block in blocks:
+            block.close()
+
+# How often (seconds) a parent waiting on a worker checks it is still alive
+WORKER_POLL_SECONDS = 1.0
+
+def _wait_for_result(library, proc, queue):
+    """Return the worker's results; raise if it failed or died silently."""
+    while True:
+        try:
+            status, payload = queue.get(timeout=WORKER_POLL_SECONDS)
+            break
+        except Empty:
+            if proc.is_alive():
+                continue
+            # It may have exited right after putting its result
+            try:
+                status, payload = queue.get(timeout=WORKER_POLL_SECONDS)
+                break
+            except Empty:
+                raise RuntimeError(f"{library} benchmark process exited with code "
+                                   f"{proc.exitcode} without a result") from None
+    proc.join()
+    if status == 'error':
+        raise RuntimeError(f"{library} benchmark process failed:\n{payload}")
+    return payload
+
+def run_isolated(data, libraries, parallel=False):
+    """Run each library's benchmarks in its own spawned process.
+
+    Each library gets a fresh interpreter and heap; the arrays are passed
+    through shared memory rather than pickled. By default the processes
+    run one after another; parallel=True runs them concurrently, at the
+    cost of CPU contention between them.
+
+    Returns {library: results}.
+    """
+    ctx = mp.get_context('spawn')
+    spec, blocks = share_data(data)
+    results = {}
+    started = []
+
+    try:
+        for library in libraries:
+            queue = ctx.Queue()
+            proc = ctx.Process(target=run_worker, args=(library, spec, queue))
+            proc.start()
+            started.append((library, proc, queue))
+            if not parallel:
+                results[library] = _wait_for_result(library, proc, queue)
+        if parallel:
+            for library, proc, queue in started:
+                results[library] = _wait_for_result(library, proc, queue)
+        return results
+    finally:
+        # Stop any worker still running (after a failure) before the shared
+        # memory goes away
+        for _, proc, _ in started:
+            if proc.is_alive():
+                proc.terminate()
+            proc.join()
+        for block in blocks:
+            block.close()
+            block.unlink()
+
 def main():
-    sizes = [10_000, 100_000, 1_000_000]
+    parser = argparse.ArgumentParser(description='Polars vs Pandas join/groupby benchmark')
+    parser.add_argument('--parallel', action='store_true',
+                        help='Run the Polars and Pandas processes concurrently '
+                             '(faster, but they contend for CPUs and skew timings)')
+    parser.add_argument('--sizes', default='10000,100000,1000000',
+                        help='Comma-separated sizes (e.g. --sizes 1000 for a quick smoke run)')
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(',')]
     
     print("="*70)
     print("POLARS vs PANDAS BENCHMARK")
     print("="*70)
     print(f"Polars version: {pl.__version__}")
     print(f"Pandas version: {pd.__version__}")
+    if NUMA_CPUS:
+        print(f"Pinned to NUMA node 0: {len(NUMA_CPUS)} CPUs")
     
     all_results = {}
     
@@ -185,11 +403,11 @@ def main():
         print(f"\nGenerating data for size {size:,}...")
         data = generate_data(size)
         
-        print("Running Polars benchmarks...")
-        polars_results = benchmark_polars(data)
-        
-        print("Running Pandas benchmarks...")
-        pandas_results = benchmark_pandas(data)
+        mode = "in parallel" if args.parallel else "sequentially"
+        print(f"Running Polars and Pandas benchmarks {mode} (one process each)...")
+        results = run_isolated(data, ['polars', 'pandas'], parallel=args.parallel)
+        polars_results = results['polars']
+        pandas_results = results['pandas']
         
         all_results[size] = {
             'polars': polars_results,
@@ -198,14 +416,17 @@ def main():
         
         print_results(size, polars_results, pandas_results)
     
-    # Print summary for 1M rows
+    # Print summary for the largest size
+    largest = max(sizes)
     print(f"\n{'='*70}")
-    print("SUMMARY - Polars times at 1M rows (for Galleon comparison)")
+    print(f"SUMMARY - Polars times at {largest:,} rows (for Galleon comparison)")
     print(f"{'='*70}")
-    polars_1m = all_results[1_000_000]['polars']
-    for op, (median, min_t, max_t) in polars_1m.items():
+    polars_largest = all_results[largest]['polars']
+    for op, (median, min_t, max_t) in polars_largest.items():
         op_name = op.replace('_', ' ').title()
         print(f"  {op_name:<20}: {median:>8.2f}ms (min: {min_t:.2f}, max: {max_t:.2f})")
+    
+    print_speedup_summary(all_results)
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,298 @@
+"""
+Shared benchmark harness for the Polars/Pandas comparison scripts.
+
+compare_all.py, compare_all_features.py, compare_polars.py and
+compare_resources.py all time operations through this module, so they
+share one warmup/iteration policy and one set of formatting helpers.
+"""
+
+import gc
+import os
+import resource
+import sys
+import time
+import tracemalloc
+from bisect import bisect_right
+from functools import lru_cache
+from statistics import fmean, pstdev
+
+import numpy as np
+
+# Seed for reproducibility - SAME seed used in Go benchmarks
+SEED = 42
+
+# Sampling policy: unless a fixed iteration count is requested, keep
+# sampling until MIN_TIME seconds of timed calls have accumulated (at
+# least MIN_SAMPLES, at most MAX_SAMPLES)
+DEFAULT_WARMUP = 1
+MIN_TIME = 0.05
+MIN_SAMPLES = 3
+MAX_SAMPLES = 1000
+
+# With inner=None, each sample runs enough back-to-back calls to last at
+# least MIN_BLOCK_TIME seconds
+MIN_BLOCK_TIME = 0.01
+
+# Measure memory with tracemalloc (Python-tracked allocations, much slower)
+# instead of result sizes; scripts set this from a --detailed flag
+DETAILED_MEMORY = False
+
+# ru_maxrss is reported in KB on Linux but in bytes on macOS
+RSS_UNITS_PER_MB = 1024 * 1024 if sys.platform == 'darwin' else 1024
+
+# ============================================================================
+# CPU Placement
+# ============================================================================
+
+def _parse_cpulist(text):
+    """Parse a sysfs cpulist such as '0-3,8-11' into a set of CPU ids."""
+    cpus = set()
+    for part in text.strip().split(','):
+        if not part:
+            continue
+        first, _, last = part.partition('-')
+        cpus.update(range(int(first), int(last or first) + 1))
+    return cpus
+
+def pin_to_numa_node(node=0):
+    """Pin this process to one NUMA node's CPUs (Linux only, best effort).
+
+    Keeps multi-threaded libraries off the remote node, where every memory
+    access pays the interconnect. Also defaults POLARS_MAX_THREADS to the
+    node's CPU count, so call it before importing polars. Returns the CPUs
+    pinned to, or None where node topology or affinity isn't available.
+    """
+    if not hasattr(os, 'sched_setaffinity'):
+        return None
+    try:
+        with open(f'/sys/devices/system/node/node{node}/cpulist') as f:
+            cpus = _parse_cpulist(f.read()) & os.sched_getaffinity(0)
+    except (OSError, ValueError):
+        return None
+    if not cpus:
+        return None
+    os.sched_setaffinity(0, cpus)
+    os.environ.setdefault('POLARS_MAX_THREADS', str(len(cpus)))
+    return cpus
+
+# ============================================================================
+# Timing
+# ============================================================================
+
+def benchmark_stats(func, *args, iterations=None, warmup=None, min_time=MIN_TIME,
+                    inner=1, setup=None):
+    """Time func(*args) and return statistics in milliseconds.
+
+    Pass bound methods (and their positional arguments) rather than
+    lambdas so each timed call is just the library call.
+
+    - iterations: fixed sample count; None applies the min_time policy.
+    - inner: calls per sample, averaged; None calibrates it so each
+      sample lasts at least MIN_BLOCK_TIME (for sub-millisecond ops).
+    - setup: called before every call, untimed, with its result passed
+      as func's first argument - for inputs that must be fresh. Each
+      sample is then a single call.
+    """
+    if warmup is None:
+        warmup = DEFAULT_WARMUP
+    if setup is not None:
+        inner = 1
+
+    for _ in range(warmup):
+        if setup is not None:
+            func(setup(), *args)
+        else:
+            func(*args)
+
+    # Local bindings keep attribute lookups out of the timed loop
+    perf = time.perf_counter_ns
+
+    if inner is None:
+        start = perf()
+        func(*args)
+        t_single = perf() - start
+        inner = max(1, int(MIN_BLOCK_TIME * 1e9 / t_single)) if t_single > 0 else 1
+
+    min_time_ns = min_time * 1e9
+    times = []
+    times_append = times.append
+    total = 0
+
+    # Keep cyclic GC pauses out of the individual samples
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        while True:
+            if iterations is not None:
+                if len(times) >= iterations:
+                    break
+            elif len(times) >= MAX_SAMPLES or (
+                    len(times) >= MIN_SAMPLES and total >= min_time_ns):
+                break
+
+            if setup is not None:
+                value = setup()
+                start = perf()
+                func(value, *args)
+                elapsed = perf() - start
+            else:
+                start = perf()
+                for _ in range(inner):
+                    func(*args)
+                elapsed = perf() - start
+            total += elapsed
+            times_append(elapsed / inner)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    # Samples are in ns
+    return {
+        'mean_ms': fmean(times) / 1e6,
+        'min_ms': min(times) / 1e6,
+        'max_ms': max(times) / 1e6,
+        'std_ms': pstdev(times) / 1e6,
+        'iterations': len(times),
+    }
+
+def benchmark(func, *args, **kwargs):
+    """Time func(*args) like benchmark_stats() and return the mean in ms."""
+    return benchmark_stats(func, *args, **kwargs)['mean_ms']
+
+# ============================================================================
+# Memory
+# ============================================================================
+
+def retained_bytes(obj):
+    """Bytes held by a benchmark result, as reported by its own library.
+
+    Polars objects report estimated_size() (their Arrow buffers), Pandas
+    objects memory_usage(deep=True) (including Python string payloads),
+    NumPy arrays nbytes. Unlike RSS readings this doesn't depend on what
+    the allocator already had on hand.
+    """
+    if hasattr(obj, 'estimated_size'):
+        return obj.estimated_size()
+    if hasattr(obj, 'memory_usage'):
+        usage = obj.memory_usage(deep=True)
+        # DataFrame.memory_usage returns one figure per column
+        return int(usage.sum()) if hasattr(usage, 'sum') else int(usage)
+    if hasattr(obj, 'nbytes'):
+        return obj.nbytes
+    if isinstance(obj, (list, tuple)):
+        return sum(retained_bytes(item) for item in obj)
+    return sys.getsizeof(obj)
+
+def _reset_peak_rss():
+    """Reset the kernel's peak-RSS watermark (Linux only, best effort)."""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+    except OSError:
+        pass
+
+def peak_rss_delta_mb(func):
+    """Growth of the process's peak RSS (MB) while running func once.
+
+    Where the watermark can't be reset, only growth beyond the previous
+    peak is seen, so this is a lower bound.
+    """
+    _reset_peak_rss()
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    func()
+    after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max(0, after - before) / RSS_UNITS_PER_MB
+
+def measure_memory_and_time(func, iterations=None):
+    """Measure execution time (ms) and memory (MB) of func().
+
+    Memory comes from a cold first call, before any timing run: the
+    retained size of its result (see retained_bytes), or tracemalloc's
+    peak with DETAILED_MEMORY. Peak RSS isn't used here because once
+    earlier runs have grown the heap, the allocator serves even large
+    results from memory it already holds and the growth reads 0.
+    """
+    gc.collect()
+    if DETAILED_MEMORY:
+        # One frame per trace is all a peak needs; deeper stacks only slow the hook
+        tracemalloc.start(1)
+        result = func()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        memory_mb = peak / 1024 / 1024
+    else:
+        result = func()
+        memory_mb = retained_bytes(result) / 1024 / 1024
+    del result
+
+    gc.collect()
+    avg_time = benchmark(func, iterations=iterations)
+
+    return avg_time, memory_mb
+
+# ============================================================================
+# Test Data
+# ============================================================================
+
+@lru_cache(maxsize=8)
+def generate_test_data(n, seed=SEED):
+    """Generate test data with fixed seed for reproducibility.
+
+    Cached per (n, seed), so every benchmark shares the same arrays. They
+    are marked read-only so no benchmark can modify them.
+    """
+    rng = np.random.default_rng(seed)
+    data = {
+        'float64': rng.standard_normal(n) * 100,
+        'float64_2': rng.standard_normal(n) * 100,
+        'int64': rng.integers(0, 1000000, n),
+        'categories': rng.choice(['cat_a', 'cat_b', 'cat_c', 'cat_d', 'cat_e'], n),
+        'group_keys': rng.integers(0, max(1, n // 100), n),
+    }
+    for arr in data.values():
+        arr.setflags(write=False)
+    return data
+
+# ============================================================================
+# Output Formatting
+# ============================================================================
+
+# format_time unit table: values below _TIME_BOUNDS[i] (in ms) use
+# _TIME_UNITS[i] as (scale, format spec, suffix)
+_TIME_BOUNDS = (0.001, 1, 1000)
+_TIME_UNITS = (
+    (1000000, '.0f', ' ns'),
+    (1000, '.1f', ' µs'),
+    (1, '.2f', ' ms'),
+    (0.001, '.2f', ' s'),
+)
+
+def format_time(ms):
+    """Format a time in milliseconds with appropriate units."""
+    if ms is None:
+        return "N/A"
+    scale, spec, suffix = _TIME_UNITS[bisect_right(_TIME_BOUNDS, ms)]
+    return f"{ms * scale:{spec}}{suffix}"
+
+def header_lines(title, width=70):
+    """The lines of a section banner, for callers that write a section at once."""
+    return ["", "=" * width, title, "=" * width]
+
+def print_header(title, width=70):
+    print("\n".join(header_lines(title, width)))
+
+def print_row(operation, polars_ms, pandas_ms):
+    """Print one Polars vs Pandas timing row with a who-is-faster note."""
+    p_str = format_time(polars_ms)
+    pd_str = format_time(pandas_ms)
+
+    # Calculate Polars vs Pandas comparison
+    if polars_ms and pandas_ms:
+        if polars_ms < pandas_ms:
+            comparison = f"Polars {pandas_ms/polars_ms:.1f}x faster"
+        else:
+            comparison = f"Pandas {polars_ms/pandas_ms:.1f}x faster"
+    else:
+        comparison = ""
+
+    print(f"{operation:<30} {p_str:>12} {pd_str:>12}  {comparison}")
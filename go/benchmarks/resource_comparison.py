@@ -3,18 +3,23 @@
 Resource usage comparison: Polars vs Galleon estimates
 """
 
+import statistics
 import time
-import resource
+from functools import lru_cache
 import numpy as np
-import polars as pl
 import os
 
-def get_memory_mb():
-    """Get current process memory usage in MB"""
-    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024 / 1024
+from harness import peak_rss_delta_mb, pin_to_numa_node
+
+# Pin to NUMA node 0 before polars starts its thread pool, so its threads
+# stay on one node and size to it
+NUMA_CPUS = pin_to_numa_node(0)
+
+import polars as pl
 
-def measure_polars_join(n, warmup=False):
-    """Measure Polars join timing"""
+@lru_cache(maxsize=4)
+def _build_join_inputs(n):
+    """Build (and cache) the left/right join DataFrames for size n"""
     np.random.seed(42)
     
     left_n = n
@@ -29,18 +34,41 @@ def measure_polars_join(n, warmup=False):
     
     left_df = pl.DataFrame({'id': left_ids, 'left_val': left_vals})
     right_df = pl.DataFrame({'id': right_ids, 'right_val': right_vals})
+    return left_df, right_df
+
+def _time_join(left_df, right_df):
+    """Time one inner join; returns (elapsed_ms, result_rows)"""
+    start = time.perf_counter_ns()
+    result = left_df.join(right_df, on='id', how='inner')
+    elapsed = (time.perf_counter_ns() - start) / 1e6
+    return elapsed, len(result)
+
+def measure_polars_join(n, iterations=5, warmup=2):
+    """Measure Polars join timing and memory
     
-    mem_before = get_memory_mb()
+    The inputs are built once, outside any timed or measured region. Memory
+    (peak RSS growth) is measured around the first (cold) join only, which
+    also counts as the first warmup run; Arrow buffer sizes come from
+    estimated_size().
+    """
+    left_df, right_df = _build_join_inputs(n)
     
-    start = time.perf_counter()
-    result = left_df.join(right_df, on='id', how='inner')
-    elapsed = (time.perf_counter() - start) * 1000
+    joined = []
+    join_rss_mb = peak_rss_delta_mb(
+        lambda: joined.append(left_df.join(right_df, on='id', how='inner')))
+    result = joined.pop()
     
-    mem_after = get_memory_mb()
+    for _ in range(warmup - 1):
+        _time_join(left_df, right_df)
+    
+    times = [_time_join(left_df, right_df)[0] for _ in range(iterations)]
     
     return {
-        'time_ms': elapsed,
-        'memory_delta_mb': mem_after - mem_before,
+        'times_ms': times,
+        'memory_delta_mb': join_rss_mb,
+        'left_mb': left_df.estimated_size('mb'),
+        'right_mb': right_df.estimated_size('mb'),
+        'result_mb': result.estimated_size('mb'),
         'result_rows': len(result),
     }
 
@@ -50,6 +78,8 @@ def main():
     print("="*70)
     print(f"\nPolars version: {pl.__version__}")
     print(f"CPU cores: {os.cpu_count()}")
+    if NUMA_CPUS:
+        print(f"Pinned to NUMA node 0: {len(NUMA_CPUS)} CPUs")
     print(f"Polars threads: {pl.thread_pool_size()}")
     
     n = 1_000_000
@@ -61,17 +91,11 @@ def main():
     print(f"Test: {n:,} rows (left={left_n:,}, right={right_n:,}, keys={num_keys:,})")
     print(f"{'='*70}")
     
-    # Warmup
-    for _ in range(2):
-        measure_polars_join(n)
-    
     # Measure Polars
-    times = []
-    for _ in range(5):
-        r = measure_polars_join(n)
-        times.append(r['time_ms'])
+    r = measure_polars_join(n)
+    times = r['times_ms']
     
-    polars_time = sorted(times)[2]  # median
+    polars_time = statistics.median(times)
     polars_min = min(times)
     polars_max = max(times)
     result_rows = r['result_rows']
@@ -81,17 +105,13 @@ def main():
     print(f"  Threads:       {pl.thread_pool_size()} (uses all cores)")
     print(f"  Result rows:   {result_rows:,}")
     
-    # Estimate Polars memory (based on their documentation)
-    # Polars pre-allocates based on cardinality estimation
-    polars_mem_estimate = (
-        left_n * 8 +           # left hashes
-        right_n * 8 +          # right hashes  
-        right_n * 4 * 4 +      # hash table (~4x)
-        right_n * 4 +          # next pointers
-        result_rows * 4 * 2    # result indices
-    ) / 1024 / 1024
-    
-    print(f"  Memory (est):  ~{polars_mem_estimate:.1f} MB")
+    # Measured, not modelled: Arrow buffer sizes plus the RSS the join needed
+    # beyond its inputs (hash table, index buffers and the result)
+    polars_join_mb = r['memory_delta_mb']
+    print(f"  Left input:    {r['left_mb']:.1f} MB")
+    print(f"  Right input:   {r['right_mb']:.1f} MB")
+    print(f"  Result:        {r['result_mb']:.1f} MB")
+    print(f"  Join RSS:      {polars_join_mb:.1f} MB (peak growth during the join)")
     
     print(f"\n--- GALLEON (from benchmarks) ---")
     galleon_time = 33  # median from our benchmarks
@@ -113,18 +133,8 @@ def main():
     
     print(f"\n--- COMPARISON ---")
     print(f"  Speed:         Polars is {galleon_time/polars_time:.2f}x faster")
-    print(f"  Memory:        Galleon saves ~{(polars_mem_estimate - galleon_mem_estimate):.1f} MB ({(1 - galleon_mem_estimate/polars_mem_estimate)*100:.0f}% less)")
-    print(f"  Threads:       Similar (8 vs 11)")
-    
-    print(f"\n--- MEMORY BREAKDOWN (1M x 500K join) ---")
-    print(f"                      Polars      Galleon     Savings")
-    print(f"  Left hashes:        {left_n*8/1024/1024:.1f} MB      0 MB        {left_n*8/1024/1024:.1f} MB (on-the-fly)")
-    print(f"  Right hashes:       {right_n*8/1024/1024:.1f} MB      {right_n*8/1024/1024:.1f} MB      0 MB")
-    print(f"  Hash table:         {right_n*4*4/1024/1024:.1f} MB      {right_n*4*4/1024/1024:.1f} MB      0 MB (adaptive)")
-    print(f"  Next pointers:      {right_n*4/1024/1024:.1f} MB      {right_n*4/1024/1024:.1f} MB      0 MB")
-    print(f"  Result arrays:      {result_rows*4*2/1024/1024:.1f} MB      {result_rows*4*2/1024/1024:.1f} MB      0 MB")
-    print(f"  ---------------------------------------------------------")
-    print(f"  TOTAL:              {polars_mem_estimate:.1f} MB      {galleon_mem_estimate:.1f} MB      {polars_mem_estimate - galleon_mem_estimate:.1f} MB")
+    print(f"  Memory:        Polars join {polars_join_mb:.1f} MB (measured) vs Galleon ~{galleon_mem_estimate:.1f} MB (est)")
+    print(f"  Threads:       Similar (8 vs {pl.thread_pool_size()})")
 
 if __name__ == '__main__':
     main()
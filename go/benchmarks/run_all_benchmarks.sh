@@ -70,6 +70,10 @@ echo "==========================================================================
 echo "RUNNING PYTHON BENCHMARKS (Polars & Pandas)"
 echo "================================================================================"
 
+# Smoke check: a tiny run of the join/groupby comparison, so a broken
+# script fails here in seconds rather than after the full sweep
+python3 /galleon/go/benchmarks/final_comparison.py --sizes 1000 > /dev/null
+
 python3 /galleon/go/benchmarks/compare_all_features.py
 
 echo ""